@@ -33,8 +33,12 @@ from loguru import logger
 # Add the parent directory to the path so we can import agentscope
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agentscope.web.workstation.workflow_importer import load_workflow, convert_to_agentscope_workflow
-from agentscope.web.workstation.workflow import start_workflow, compile_workflow
+from agentscope.web.workstation.workflow import (
+    load_config,
+    start_workflow,
+    compile_workflow,
+    run_and_compile_workflow,
+)
 
 
 def main():
@@ -86,27 +90,30 @@ def main():
     run_workflow = args.run
 
     try:
-        # Load the workflow configuration
-        logger.info(f"Loading workflow from {workflow_file}")
-        config = load_workflow(workflow_file)
+        # Load the workflow configuration and convert it to AgentScope
+        # format if needed
+        logger.info("Loading workflow from {}", workflow_file)
+        config = load_config(workflow_file)
 
-        # Convert the configuration to AgentScope format if needed
-        config = convert_to_agentscope_workflow(config)
+        if compile_file and run_workflow:
+            # Build the DAG once and share it between compiling and running
+            logger.info("Compiling workflow to {} and running it", compile_file)
+            run_and_compile_workflow(config, compile_file)
 
         # Compile the workflow if requested
-        if compile_file:
-            logger.info(f"Compiling workflow to {compile_file}")
+        elif compile_file:
+            logger.info("Compiling workflow to {}", compile_file)
             compile_workflow(config, compile_file)
 
         # Run the workflow if requested
-        if run_workflow:
+        elif run_workflow:
             logger.info("Running workflow")
             start_workflow(config)
 
         logger.info("Workflow import completed successfully")
 
     except Exception as e:
-        logger.error(f"Error importing workflow: {e}")
+        logger.error("Error importing workflow: {}", e)
         sys.exit(1)
 
 
@@ -25,6 +25,7 @@ If any test fails, it will exit with an error message and a non-zero exit code.
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 
 # Add the parent directory to the path so we can import agentscope
@@ -55,7 +56,7 @@ def test_json_workflow():
     """
     json_file = os.path.join(os.path.dirname(__file__), 'workflow_example.json')
 
-    logger.info(f"Testing JSON workflow import from {json_file}")
+    logger.info("Testing JSON workflow import from {}", json_file)
 
     # Load the JSON workflow
     config = load_workflow(json_file)
@@ -71,9 +72,8 @@ def test_json_workflow():
     assert len(config["modules"]) == 4, f"Expected 4 modules, got {len(config['modules'])}"
 
     # Verify connections
-    assert "1" in config["connections"], "Connection from module 1 not found"
-    assert "2" in config["connections"], "Connection from module 2 not found"
-    assert "3" in config["connections"], "Connection from module 3 not found"
+    missing = {"1", "2", "3"} - config["connections"].keys()
+    assert not missing, f"Connections from modules {sorted(missing)} not found"
 
     logger.info("JSON workflow import test passed")
     return config
@@ -101,7 +101,7 @@ def test_xml_workflow():
     """
     xml_file = os.path.join(os.path.dirname(__file__), 'workflow_example.xml')
 
-    logger.info(f"Testing XML workflow import from {xml_file}")
+    logger.info("Testing XML workflow import from {}", xml_file)
 
     # Load the XML workflow
     config = load_workflow(xml_file)
@@ -129,8 +129,9 @@ def compare_workflows(json_config, xml_config):
 
     This function verifies that workflow configurations loaded from different file formats
     (JSON and XML) are consistent with each other. It checks that both configurations have
-    the same number of modules and connections, ensuring that the workflow importer
-    produces equivalent results regardless of the input format.
+    the same number of modules and connections, and the same module ids and connection
+    sources, ensuring that the workflow importer produces equivalent results regardless
+    of the input format.
 
     Args:
         json_config (dict): The workflow configuration loaded from a JSON file.
@@ -140,7 +141,7 @@ def compare_workflows(json_config, xml_config):
         AssertionError: If the configurations are not consistent with each other.
 
     Note:
-        This function only checks for structural consistency (number of modules and connections).
+        This function only checks for structural consistency (module ids and connection sources).
         It does not perform a deep comparison of the configuration contents.
     """
     logger.info("Comparing JSON and XML workflow configurations")
@@ -153,6 +154,15 @@ def compare_workflows(json_config, xml_config):
     assert len(json_config["connections"]) == len(xml_config["connections"]), \
         f"Different number of connections: JSON={len(json_config['connections'])}, XML={len(xml_config['connections'])}"
 
+    # Compare the module ids and connection sources as sets
+    json_ids = {module["id"] for module in json_config["modules"]}
+    xml_ids = {module["id"] for module in xml_config["modules"]}
+    assert json_ids == xml_ids, \
+        f"Different module ids: JSON={sorted(json_ids)}, XML={sorted(xml_ids)}"
+
+    assert json_config["connections"].keys() == xml_config["connections"].keys(), \
+        "Different connection sources between JSON and XML"
+
     logger.info("Workflow comparison passed")
 
 
@@ -161,7 +171,7 @@ def main():
     Run all tests for the workflow importer.
 
     This function orchestrates the execution of all test functions in this script.
-    It runs each test in sequence, collects the results, and reports the overall
+    It runs the JSON and XML tests concurrently, collects the results, and reports the overall
     test status. If any test fails, the function will exit with a non-zero status code.
 
     The function includes error handling to provide clear error messages when tests fail,
@@ -175,11 +185,12 @@ def main():
         SystemExit: If any test fails, the function will exit with a non-zero status code.
     """
     try:
-        # Test JSON workflow
-        json_config = test_json_workflow()
-
-        # Test XML workflow
-        xml_config = test_xml_workflow()
+        # Test JSON and XML workflows concurrently, as they are independent
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            json_future = executor.submit(test_json_workflow)
+            xml_future = executor.submit(test_xml_workflow)
+            json_config = json_future.result()
+            xml_config = xml_future.result()
 
         # Compare the workflows
         compare_workflows(json_config, xml_config)
@@ -187,7 +198,7 @@ def main():
         logger.info("All tests passed!")
 
     except Exception as e:
-        logger.error(f"Test failed: {e}")
+        logger.error("Test failed: {}", e)
         sys.exit(1)
 
 
@@ -21,13 +21,16 @@ Typical usage:
     compile_workflow(config, "output.py")
 """
 import argparse
-import json
 import os
+import py_compile
 
 from loguru import logger
-from agentscope.web.workstation.workflow_dag import build_dag
 from agentscope.web.workstation.workflow_importer import load_workflow, convert_to_agentscope_workflow
 
+# Accepted answers to the overwrite prompt in main()
+_NO_ANSWERS = frozenset({"no", "n", "false"})
+_YES_ANSWERS = frozenset({"", "yes", "y", "true"})
+
 
 def load_config(config_path: str) -> dict:
     """Load a workflow configuration file (JSON or XML).
@@ -37,6 +40,11 @@ def load_config(config_path: str) -> dict:
     It handles both JSON and XML formats through the workflow_importer module,
     and ensures the loaded configuration is compatible with AgentScope's workflow system.
 
+    Files are parsed through load_workflow, which caches them per
+    ``(abspath, st_mtime_ns, st_size)``, so repeated loads of an unchanged file
+    skip parsing entirely. Each call returns a new configuration, since
+    ``build_dag`` mutates the configuration in place.
+
     The function includes error handling to provide clear error messages when loading fails.
 
     Args:
@@ -57,18 +65,29 @@ def load_config(config_path: str) -> dict:
         >>> # Now use the config with start_workflow or compile_workflow
     """
     try:
-        # Use the workflow importer to load the file based on its extension
+        # Use the workflow importer to load and convert the file; the loader
+        # reuses its cached parse if the file has not changed since
         config = load_workflow(config_path)
-
-        # Convert the configuration to AgentScope format if needed
-        config = convert_to_agentscope_workflow(config)
-
-        return config
+        return convert_to_agentscope_workflow(config)
     except Exception as e:
-        logger.error(f"Failed to load configuration file: {e}")
+        logger.error("Failed to load configuration file: {}", e)
         raise
 
 
+def _precompile(compiled_filename: str) -> None:
+    """Byte-compile a generated workflow script next to its source.
+
+    This writes the ``__pycache__`` entry that importing the script would
+    otherwise produce, and surfaces syntax errors in the generated code early.
+    Failures are logged rather than raised, since the script itself has
+    already been written.
+    """
+    try:
+        py_compile.compile(compiled_filename, doraise=True)
+    except (py_compile.PyCompileError, OSError) as e:
+        logger.warning("Failed to precompile {}: {}", compiled_filename, e)
+
+
 def start_workflow(config: dict) -> None:
     """Start the application workflow based on the given configuration.
 
@@ -96,6 +115,10 @@ def start_workflow(config: dict) -> None:
         >>> config = load_config("workflow.json")
         >>> start_workflow(config)  # Execute the workflow
     """
+    # Imported lazily, since it pulls in agents, models and services, which
+    # the CLI does not need for --help or argument errors
+    from agentscope.web.workstation.workflow_dag import build_dag
+
     logger.info("Launching...")
 
     dag = build_dag(config)
@@ -111,8 +134,9 @@ def compile_workflow(config: dict, compiled_filename: str = "main.py") -> None:
     script that can be executed independently. The compiled script includes all necessary
     imports, initialization code, and the workflow execution logic.
 
-    The function logs the start and completion of the compilation process, providing
-    feedback on the compilation's progress.
+    The written script is also byte-compiled, so that its ``.pyc`` is ready before the
+    first import. The function logs the start and completion of the compilation process,
+    providing feedback on the compilation's progress.
 
     Args:
         config (dict): A dictionary containing the workflow configuration, with modules,
@@ -134,10 +158,57 @@ def compile_workflow(config: dict, compiled_filename: str = "main.py") -> None:
         >>> config = load_config("workflow.json")
         >>> compile_workflow(config, "my_workflow.py")  # Compile to a Python script
     """
+    from agentscope.web.workstation.workflow_dag import build_dag
+
     logger.info("Compiling...")
 
     dag = build_dag(config)
     dag.compile(compiled_filename)
+    _precompile(compiled_filename)
+
+    logger.info("Finished.")
+
+
+def run_and_compile_workflow(
+    config: dict,
+    compiled_filename: str = "main.py",
+) -> None:
+    """Compile the workflow to a Python script and then run it.
+
+    This function is equivalent to calling compile_workflow followed by
+    start_workflow, but builds the DAG only once and shares it between the
+    two steps. Since build_dag sanitizes the configuration in place, reusing
+    the DAG also avoids building a second graph from an already sanitized
+    configuration.
+
+    Args:
+        config (dict): A dictionary containing the workflow configuration, with modules,
+                      connections, and optional metadata, typically loaded by load_config.
+        compiled_filename (str, optional): The name of the output Python file. Defaults to "main.py".
+
+    Returns:
+        None: This function does not return a value, but writes the compiled Python script
+              and executes the workflow.
+
+    Raises:
+        ValueError: If the configuration is invalid or cannot be used to build a DAG.
+        IOError: If the output file cannot be written.
+        Exception: Any exceptions that might occur during compilation or execution.
+
+    Example:
+        >>> config = load_config("workflow.json")
+        >>> run_and_compile_workflow(config, "my_workflow.py")
+    """
+    from agentscope.web.workstation.workflow_dag import build_dag
+
+    dag = build_dag(config)
+
+    logger.info("Compiling...")
+    dag.compile(compiled_filename)
+    _precompile(compiled_filename)
+
+    logger.info("Launching...")
+    dag.run()
 
     logger.info("Finished.")
 
@@ -197,24 +268,34 @@ def main() -> None:
     compiled_filename = args.compile
 
     if cfg_path:
-        config = load_config(cfg_path)
         if not compiled_filename:
+            config = load_config(cfg_path)
             start_workflow(config)
         else:
-            if os.path.exists(compiled_filename):
+            # Confirm the overwrite before loading, so that a refusal does
+            # not pay for parsing the config file
+            try:
+                os.stat(compiled_filename)
+                compiled_file_exists = True
+            except FileNotFoundError:
+                compiled_file_exists = False
+
+            if compiled_file_exists:
                 while True:
                     user_input = input(
                         f"File 【{compiled_filename}】already exists, are you "
                         f"sure to overwrite? (yes/no)",
                     )
-                    if user_input.lower() in ["no", "n", "false"]:
+                    answer = user_input.strip().lower()
+                    if answer in _NO_ANSWERS:
                         raise FileExistsError(compiled_filename)
 
-                    if user_input.lower() in ["", "yes", "y", "true"]:
-                        logger.warning(f"Overwrite 【{compiled_filename}】!")
+                    if answer in _YES_ANSWERS:
+                        logger.warning("Overwrite 【{}】!", compiled_filename)
                         break
 
                     logger.info("Invalid input.")
+            config = load_config(cfg_path)
             compile_workflow(config, compiled_filename)
     else:
         raise FileNotFoundError("Please provide config file.")
@@ -23,17 +23,21 @@ Typical usage:
     # or
     dag.compile("output.py")  # Compile to a Python script
 """
-import copy
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import TopologicalSorter
 from typing import Any
 from loguru import logger
 
 import agentscope
 from agentscope.web.workstation.workflow_node import (
-    NODE_NAME_MAPPING,
     WorkflowNodeType,
     DEFAULT_FLOW_VAR,
+    deferred_model_config_loading,
+    get_node_class,
+    precompute_pipeline_agents,
 )
 from agentscope.web.workstation.workflow_utils import (
+    evaluate_expression,
     is_callable_expression,
     kwarg_converter,
 )
@@ -46,29 +50,25 @@ except ImportError:
 
 def remove_duplicates_from_end(lst: list) -> list:
     """
-    Remove duplicate elements from a list while preserving the order of first occurrence.
+    Remove duplicate elements from a list, keeping the last occurrence of each.
 
-    This function processes the list in reverse order, keeping track of seen elements
-    to remove duplicates. The result is a list with only the first occurrence of each
-    element preserved, which is useful for removing duplicate import statements while
-    maintaining their original order.
+    This function deduplicates the list from the end, so that each element is kept
+    at the position of its last occurrence and the relative order of the kept
+    elements is preserved. This is useful for removing duplicate import statements
+    while maintaining their original order. The deduplication is done with an
+    insertion-ordered dict, which keeps the loop in C.
 
     Args:
         lst (list): The input list that may contain duplicate elements.
 
     Returns:
-        list: A new list with duplicates removed, preserving the order of first occurrence.
+        list: A new list with duplicates removed, keeping the last occurrence of each.
 
     Example:
         >>> remove_duplicates_from_end(['import a', 'import b', 'import a'])
-        ['import a', 'import b']
+        ['import b', 'import a']
     """
-    seen = set()
-    result = []
-    for item in reversed(lst):
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
+    result = list(dict.fromkeys(reversed(lst)))
     result.reverse()
     return result
 
@@ -108,6 +108,9 @@ class ASDiGraph(nx.DiGraph):
             *args: Variable length argument list passed to the parent class constructor.
             **kwargs: Arbitrary keyword arguments passed to the parent class constructor.
         """
+        # Operator of each node, keyed by node ID. Set before the parent
+        # constructor, which may add nodes from incoming graph data
+        self._opts = {}
         super().__init__(*args, **kwargs)
         self.nodes_not_in_graph = set()
 
@@ -124,53 +127,167 @@ class ASDiGraph(nx.DiGraph):
 
         self.execs = ["\n"]
 
-    def run(self) -> None:
+        # Compiled code of each node, keyed by node ID
+        self._compile_dicts = {}
+
+        # Topological order of all nodes, built on first use and dropped
+        # whenever the nodes or edges change
+        self._sorted_cache = None
+
+    # The overrides below cover every DiGraph method that changes the nodes
+    # or edges directly; the others, such as update(), go through them. They
+    # invalidate the cached topological order, and the direct lookup table of
+    # node operators, which is filled on first execution of each node
+    def add_node(self, node_for_adding, **attr):  # type: ignore[no-untyped-def]
+        """Add a node and invalidate the cached order and operator."""
+        self._sorted_cache = None
+        self._opts.pop(node_for_adding, None)
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):  # type: ignore[no-untyped-def]
+        """Add nodes and invalidate the cached order and operators."""
+        self._sorted_cache = None
+        self._opts.clear()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_node(self, n):  # type: ignore[no-untyped-def]
+        """Remove a node and invalidate the cached order and operator."""
+        self._sorted_cache = None
+        self._opts.pop(n, None)
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):  # type: ignore[no-untyped-def]
+        """Remove nodes and invalidate the cached order and operators."""
+        self._sorted_cache = None
+        self._opts.clear()
+        super().remove_nodes_from(nodes)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):  # type: ignore[no-untyped-def]
+        """Add an edge and invalidate the cached topological order."""
+        self._sorted_cache = None
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):  # type: ignore[no-untyped-def]
+        """Add edges and invalidate the cached topological order."""
+        self._sorted_cache = None
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v):  # type: ignore[no-untyped-def]
+        """Remove an edge and invalidate the cached topological order."""
+        self._sorted_cache = None
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):  # type: ignore[no-untyped-def]
+        """Remove edges and invalidate the cached topological order."""
+        self._sorted_cache = None
+        super().remove_edges_from(ebunch)
+
+    def clear_edges(self):  # type: ignore[no-untyped-def]
+        """Remove all edges and invalidate the cached topological order."""
+        self._sorted_cache = None
+        super().clear_edges()
+
+    def clear(self):  # type: ignore[no-untyped-def]
+        """Remove all nodes and edges, and invalidate the cached order and
+        operators."""
+        self._sorted_cache = None
+        self._opts.clear()
+        super().clear()
+
+    def _sorted_nodes(self) -> list:
         """
-        Execute the workflow by running each node in topological order.
+        Return the nodes of the computation graph in topological order.
+
+        Nodes in nodes_not_in_graph are left out. The topological order of all
+        nodes is computed once and cached until the graph is next mutated, and
+        filtered on each call, so that changes to nodes_not_in_graph are
+        always taken into account.
+
+        Returns:
+            list: The IDs of the nodes to execute, in topological order.
+        """
+        if self._sorted_cache is None:
+            self._sorted_cache = list(nx.topological_sort(self))
+        skip = self.nodes_not_in_graph
+        return [
+            node_id for node_id in self._sorted_cache if node_id not in skip
+        ]
+
+    def run(self, max_workers: int = 1) -> None:
+        """
+        Execute the workflow by running its nodes in topological order.
 
         This method executes the workflow represented by the DAG. It first initializes
-        AgentScope, then performs a topological sort of the nodes to determine the
-        execution order. Each node is executed in sequence, with the outputs from its
-        predecessors passed as inputs.
+        AgentScope, then runs the nodes one after another in the same topological order
+        that compile() uses, so running a DAG and running its compiled script execute
+        the nodes, and their side effects, in the same order.
+
+        With more than one worker, the nodes are instead scheduled with
+        graphlib.TopologicalSorter: every node whose predecessors have all finished is
+        ready, and each batch of ready nodes, whose members do not depend on each other,
+        is executed concurrently in a thread pool. This overlaps the network-bound model
+        and agent calls of independent nodes, at the cost of a different execution order.
 
         The method handles the flow of data between nodes, ensuring that each node
         receives the appropriate inputs from its predecessors. Currently, the method
         only supports passing the output of the first predecessor as input to a node.
 
+        Args:
+            max_workers (int, optional): The maximum number of nodes executed at the
+                                        same time. Nodes may share agents, so this
+                                        defaults to 1, which executes the nodes
+                                        sequentially in compile order.
+
         Returns:
             None: This method does not return a value, but executes the workflow.
 
         Raises:
-            ValueError: If a node has too many predecessors or if there are other issues
-                      with the workflow execution.
             Exception: Any exceptions that might occur during workflow execution.
         """
         agentscope.init(logger_level="DEBUG")
-        sorted_nodes = list(nx.topological_sort(self))
-        sorted_nodes = [
-            node_id
-            for node_id in sorted_nodes
-            if node_id not in self.nodes_not_in_graph
-        ]
-        logger.info(f"sorted_nodes: {sorted_nodes}")
-        logger.info(f"nodes_not_in_graph: {self.nodes_not_in_graph}")
+        logger.info("nodes_not_in_graph: {}", self.nodes_not_in_graph)
+
+        # Read the reverse adjacency once instead of calling predecessors()
+        # for every executed node
+        predecessors = {
+            node_id: list(preds) for node_id, preds in self._pred.items()
+        }
 
         # Cache output
         values = {}
 
-        # Run with predecessors outputs
-        for node_id in sorted_nodes:
-            inputs = [
-                values[predecessor]
-                for predecessor in self.predecessors(node_id)
-            ]
-            if not inputs:
-                values[node_id] = self.exec_node(node_id)
-            elif len(inputs):
-                # Note: only support exec with the first predecessor now
-                values[node_id] = self.exec_node(node_id, inputs[0])
-            else:
-                raise ValueError("Too many predecessors!")
+        def exec_with_inputs(node_id: str) -> Any:
+            preds = predecessors[node_id]
+            if not preds:
+                return self.exec_node(node_id)
+            # Note: only support exec with the first predecessor now
+            return self.exec_node(node_id, values[preds[0]])
+
+        if max_workers <= 1:
+            sorted_nodes = self._sorted_nodes()
+            logger.info("sorted_nodes: {}", sorted_nodes)
+
+            # Run with predecessors outputs
+            for node_id in sorted_nodes:
+                values[node_id] = exec_with_inputs(node_id)
+            return
+
+        skip = self.nodes_not_in_graph
+        sorter = TopologicalSorter(predecessors)
+        sorter.prepare()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while sorter.is_active():
+                ready = sorter.get_ready()
+                batch = [
+                    node_id for node_id in ready if node_id not in skip
+                ]
+                logger.info("ready_nodes: {}", batch)
+
+                # Run with predecessors outputs
+                outputs = executor.map(exec_with_inputs, batch)
+                for node_id, output in zip(batch, outputs):
+                    values[node_id] = output
+                sorter.done(*ready)
 
     def compile(  # type: ignore[no-untyped-def]
         self,
@@ -217,31 +334,32 @@ class ASDiGraph(nx.DiGraph):
             0
         ] = f'agentscope.init(logger_level="DEBUG", {kwarg_converter(kwargs)})'
 
-        sorted_nodes = list(nx.topological_sort(self))
-        sorted_nodes = [
-            node_id
-            for node_id in sorted_nodes
-            if node_id not in self.nodes_not_in_graph
-        ]
-
-        for node_id in sorted_nodes:
-            node = self.nodes[node_id]
-            self.execs.append(node["compile_dict"]["execs"])
+        sorted_nodes = self._sorted_nodes()
 
-        header = "\n".join(self.imports)
+        # Collect the per-node snippets into a local list, so that the
+        # graph state is untouched and compiling twice gives the same script
+        compile_dicts = self._compile_dicts
+        execs = self.execs + [
+            compile_dicts[node_id]["execs"] for node_id in sorted_nodes
+        ]
 
-        # Remove duplicate import
-        new_imports = remove_duplicates_from_end(header.split("\n"))
+        # Remove duplicate import lines; a single entry may hold several
+        # lines, so split the entries rather than the joined header
+        new_imports = remove_duplicates_from_end(
+            [line for imports in self.imports for line in imports.split("\n")],
+        )
         header = "\n".join(new_imports)
-        body = "\n    ".join(self.inits + self.execs)
-
-        main_body = f"def main():\n    {body}"
-
-        # Combine header and body to form the full script
-        script = (
-            "# -*- coding: utf-8 -*-\n"
-            f"{header}\n\n\n{main_body}\n\nif __name__ == "
-            f"'__main__':\n    main()\n"
+        body = "\n    ".join(self.inits + execs)
+
+        # Combine header and body to form the full script in a single join
+        script = "".join(
+            [
+                "# -*- coding: utf-8 -*-\n",
+                header,
+                "\n\n\ndef main():\n    ",
+                body,
+                "\n\nif __name__ == '__main__':\n    main()\n",
+            ],
         )
 
         formatted_code = format_python_code(script)
@@ -252,7 +370,6 @@ class ASDiGraph(nx.DiGraph):
                 file.write(formatted_code)
         return formatted_code
 
-    # pylint: disable=R0912
     def add_as_node(
         self,
         node_id: str,
@@ -267,8 +384,9 @@ class ASDiGraph(nx.DiGraph):
         initializes the node with the specified parameters, and adds it to the graph.
 
         The method also handles dependencies between nodes, ensuring that dependent nodes
-        are added to the graph before the current node. It recursively adds any dependent
-        nodes that are not already in the graph.
+        are added to the graph before the current node. Dependencies that are not already
+        in the graph are resolved depth-first with an explicit stack, so deeply nested
+        groups do not run into the interpreter's recursion limit.
 
         For nodes that are part of a group (e.g., nodes within a pipeline), the method
         excludes them from the main DAG execution by adding them to the nodes_not_in_graph set.
@@ -287,37 +405,73 @@ class ASDiGraph(nx.DiGraph):
 
         Raises:
             NotImplementedError: If the node type is not supported.
-            ValueError: If there are issues with the node configuration or dependencies.
+            ValueError: If a node is nested, directly or indirectly, within itself.
             Exception: Any other exceptions that might occur during node creation.
         """
-        node_cls = NODE_NAME_MAPPING[node_info.get("name", "")]
-        if node_cls.node_type not in [
-            WorkflowNodeType.MODEL,
-            WorkflowNodeType.AGENT,
-            WorkflowNodeType.MESSAGE,
-            WorkflowNodeType.PIPELINE,
-            WorkflowNodeType.COPY,
-            WorkflowNodeType.SERVICE,
-        ]:
-            raise NotImplementedError(node_cls)
-
-        if self.has_node(node_id):
-            return self.nodes[node_id]["opt"]
-
-        # Init dep nodes
+        nodes = self.nodes
+        if node_id in nodes:
+            return nodes[node_id]["opt"]
+        node_cls = _get_node_cls(node_info)
+
+        # Each frame holds a node whose dependencies are being resolved, and
+        # an iterator over the dependencies that have not been visited yet
+        stack = [self._open_node_frame(node_id, node_info, node_cls)]
+        in_progress = {node_id}
+        while stack:
+            frame_id, frame_info, frame_cls, deps, pending = stack[-1]
+            for dep_node_id in pending:
+                if dep_node_id in nodes:
+                    continue
+                if dep_node_id in in_progress:
+                    raise ValueError(
+                        f"Node {dep_node_id} is nested within itself.",
+                    )
+                dep_node_info = config[dep_node_id]
+                stack.append(
+                    self._open_node_frame(
+                        dep_node_id,
+                        dep_node_info,
+                        _get_node_cls(dep_node_info),
+                    ),
+                )
+                in_progress.add(dep_node_id)
+                break
+            else:
+                # All dependencies are in the graph, build the node itself
+                stack.pop()
+                in_progress.discard(frame_id)
+                self._build_node(
+                    frame_id,
+                    frame_info,
+                    frame_cls,
+                    [nodes[dep_node_id]["opt"] for dep_node_id in deps],
+                )
+        return nodes[node_id]["opt"]
+
+    def _open_node_frame(
+        self,
+        node_id: str,
+        node_info: dict,
+        node_cls: type,
+    ) -> tuple:
+        """Start adding a node, returning its frame for add_as_node."""
         deps = [str(n) for n in node_info.get("data", {}).get("elements", [])]
 
         # Exclude for dag when in a Group
         if node_cls.node_type != WorkflowNodeType.COPY:
-            self.nodes_not_in_graph = self.nodes_not_in_graph.union(set(deps))
+            self.nodes_not_in_graph.update(deps)
 
-        dep_opts = []
-        for dep_node_id in deps:
-            if not self.has_node(dep_node_id):
-                dep_node_info = config[dep_node_id]
-                self.add_as_node(dep_node_id, dep_node_info, config)
-            dep_opts.append(self.nodes[dep_node_id]["opt"])
+        return node_id, node_info, node_cls, deps, iter(deps)
 
+    def _build_node(
+        self,
+        node_id: str,
+        node_info: dict,
+        node_cls: type,
+        dep_opts: list,
+    ) -> Any:
+        """Create a node whose dependencies are already in the graph, and add
+        it with its compiled code."""
         node_opt = node_cls(
             node_id=node_id,
             opt_kwargs=node_info["data"].get("args", {}),
@@ -325,15 +479,23 @@ class ASDiGraph(nx.DiGraph):
             dep_opts=dep_opts,
         )
 
+        if node_cls.node_type == WorkflowNodeType.PIPELINE:
+            precompute_pipeline_agents(node_opt)
+
         # Add build compiled python code
         compile_dict = node_opt.compile()
 
+        # The class resolved by sanitize_node_data is not node data, so keep
+        # it out of the node attributes and the config
+        node_info.pop("_node_cls", None)
+        node_info.pop("_node_type", None)
         self.add_node(
             node_id,
             opt=node_opt,
             compile_dict=compile_dict,
             **node_info,
         )
+        self._compile_dicts[node_id] = compile_dict
 
         # Insert compile information to imports and inits
         self.imports.append(compile_dict["imports"])
@@ -371,17 +533,43 @@ class ASDiGraph(nx.DiGraph):
             KeyError: If the specified node_id is not found in the graph.
             Exception: Any exceptions that might occur during the node's computation.
         """
-        logger.debug(
-            f"\nnode_id: {node_id}\nin_values:{x_in}",
+        # Rendered lazily, so large inputs are only formatted when a sink
+        # accepts debug records
+        logger.opt(lazy=True).debug(
+            "\nnode_id: {}\nin_values:{}",
+            lambda: node_id,
+            lambda: x_in,
         )
-        opt = self.nodes[node_id]["opt"]
+        opt = self._opts.get(node_id)
+        if opt is None:
+            opt = self._opts[node_id] = self.nodes[node_id]["opt"]
         out_values = opt(x_in)
-        logger.debug(
-            f"\nnode_id: {node_id}\nout_values:{out_values}",
+        logger.opt(lazy=True).debug(
+            "\nnode_id: {}\nout_values:{}",
+            lambda: node_id,
+            lambda: out_values,
         )
         return out_values
 
 
+def _get_node_cls(node_info: dict) -> type:
+    """Return the node class of a node, checking that its type is supported
+    in a DAG."""
+    node_cls = node_info.get("_node_cls")
+    if node_cls is None:
+        node_cls = get_node_class(node_info.get("name", ""))
+    if node_cls.node_type not in [
+        WorkflowNodeType.MODEL,
+        WorkflowNodeType.AGENT,
+        WorkflowNodeType.MESSAGE,
+        WorkflowNodeType.PIPELINE,
+        WorkflowNodeType.COPY,
+        WorkflowNodeType.SERVICE,
+    ]:
+        raise NotImplementedError(node_cls)
+    return node_cls
+
+
 def sanitize_node_data(raw_info: dict) -> dict:
     """
     Clean and validate node data, evaluating callable expressions where necessary.
@@ -389,14 +577,19 @@ def sanitize_node_data(raw_info: dict) -> dict:
     This function processes raw node information from a workflow configuration,
     performing several transformations to prepare it for use in building a workflow DAG:
 
-    1. It creates a deep copy of the original data to avoid modifying the input
-    2. It preserves the original arguments in a 'source' field for reference
-    3. It removes empty arguments that might cause issues during execution
-    4. It evaluates any callable expressions provided as string literals
+    1. It preserves the original arguments in a 'source' field for reference, using a
+       shallow copy since only top-level arguments are replaced
+    2. It removes empty arguments that might cause issues during execution
+    3. It evaluates any callable expressions provided as string literals
+
+    The node class and node type looked up from NODE_NAME_MAPPING are stored under the
+    '_node_cls' and '_node_type' keys, so later passes do not need to look them up again.
+    These keys are removed again once the node is added to the graph. The node
+    information is updated in place and returned.
 
     Callable expressions are strings that represent Python functions or objects that
-    can be called. These are evaluated using eval() to convert them from strings to
-    actual callable objects.
+    can be called. These are evaluated with only the builtins in scope to convert them
+    from strings to actual callable objects, and only their compiled code is cached.
 
     Args:
         raw_info (dict): The raw node information dictionary from the workflow configuration.
@@ -407,22 +600,31 @@ def sanitize_node_data(raw_info: dict) -> dict:
              expressions evaluated. The original arguments are preserved in the 'source' field.
 
     Raises:
+        KeyError: If the node name is not a known node type.
         Exception: Any exceptions that might occur during evaluation of callable expressions.
     """
 
-    copied_info = copy.deepcopy(raw_info)
-    raw_info["data"]["source"] = copy.deepcopy(
-        copied_info["data"].get(
-            "args",
-            {},
-        ),
-    )
-    for key, value in copied_info["data"].get("args", {}).items():
-        if value == "":
-            raw_info["data"]["args"].pop(key)
-            raw_info["data"]["source"].pop(key)
-        elif is_callable_expression(value):
-            raw_info["data"]["args"][key] = eval(value)
+    # Resolve the node class once, failing fast on unknown node names
+    node_cls = get_node_class(raw_info.get("name", ""))
+    raw_info["_node_cls"] = node_cls
+    raw_info["_node_type"] = node_cls.node_type
+
+    data = raw_info["data"]
+    source = {
+        key: value
+        for key, value in data.get("args", {}).items()
+        if value != ""
+    }
+    data["source"] = source
+    if "args" in data:
+        data["args"] = {
+            key: (
+                evaluate_expression(value)
+                if is_callable_expression(value)
+                else value
+            )
+            for key, value in source.items()
+        }
     return raw_info
 
 
@@ -465,52 +667,54 @@ def build_dag(config: dict) -> ASDiGraph:
     # for html json file,
     # retrieve the contents of config["drawflow"]["Home"]["data"],
     # and remove the node whose class is "welcome"
-    if (
-        "drawflow" in config
-        and "Home" in config["drawflow"]
-        and "data" in config["drawflow"]["Home"]
-    ):
-        config = config["drawflow"]["Home"]["data"]
-
-        config = {
-            k: v
-            for k, v in config.items()
-            if not ("class" in v and v["class"] == "welcome")
-        }
-
+    data = config.get("drawflow", {}).get("Home", {}).get("data")
+    if data is not None:
+        config = {k: v for k, v in data.items() if v.get("class") != "welcome"}
+
+    # Sanitize all nodes and partition them by type in a single pass. Every
+    # node is sanitized before any is added, since adding a node may add its
+    # dependencies from the config
+    model_items = []
+    other_items = []
     for node_id, node_info in config.items():
         config[node_id] = sanitize_node_data(node_info)
+        if node_info["_node_type"] == WorkflowNodeType.MODEL:
+            model_items.append((node_id, node_info))
+        else:
+            other_items.append((node_id, node_info))
 
-    # Add and init model nodes first
-    for node_id, node_info in config.items():
-        if (
-            NODE_NAME_MAPPING[node_info["name"]].node_type
-            == WorkflowNodeType.MODEL
-        ):
+    # Add and init model nodes first, loading all their configs at once
+    # before any agent needs them, then non-model nodes
+    with deferred_model_config_loading():
+        for node_id, node_info in model_items:
             dag.add_as_node(node_id, node_info, config)
-
-    # Add and init non-model nodes
-    for node_id, node_info in config.items():
-        if (
-            NODE_NAME_MAPPING[node_info["name"]].node_type
-            != WorkflowNodeType.MODEL
-        ):
-            dag.add_as_node(node_id, node_info, config)
-
-    # Add edges
-    for node_id, node_info in config.items():
-        outputs = node_info.get("outputs", {})
-        for output_key, output_val in outputs.items():
-            connections = output_val.get("connections", [])
-            for conn in connections:
-                target_node_id = conn.get("node")
-                # Here it is assumed that the output of the connection is
-                # only connected to one of the inputs. If there are more
-                # complex connections, modify the logic accordingly
-                dag.add_edge(node_id, target_node_id, output_key=output_key)
+    for node_id, node_info in other_items:
+        dag.add_as_node(node_id, node_info, config)
+
+    # Add edges in a single batch.
+    # Here it is assumed that the output of the connection is only connected
+    # to one of the inputs. If there are more complex connections, modify the
+    # logic accordingly
+    dag.add_edges_from(
+        (node_id, conn.get("node"), {"output_key": output_key})
+        for node_id, node_info in config.items()
+        for output_key, output_val in node_info.get("outputs", {}).items()
+        for conn in output_val.get("connections", [])
+    )
 
     # Check if the graph is a DAG
     if not nx.is_directed_acyclic_graph(dag):
         raise ValueError("The provided configuration does not form a DAG.")
 
+    # run() only passes the output of the first predecessor to a node, so
+    # report the nodes whose other inputs are dropped once, at build time
+    for node_id, in_degree in dag.in_degree():
+        if in_degree > 1:
+            logger.warning(
+                "Node {} has {} predecessors, only the output of the first "
+                "one is used as its input.",
+                node_id,
+                in_degree,
+            )
+
     return dag
@@ -9,8 +9,9 @@ external workflow definition formats and AgentScope's internal workflow represen
 The module supports:
 1. Loading workflow configurations from JSON files
 2. Loading workflow configurations from XML files
-3. Converting between different workflow formats
-4. Validating workflow configurations for compatibility with AgentScope
+3. Loading gzip or zstd compressed JSON and XML workflow files
+4. Converting between different workflow formats
+5. Validating workflow configurations for compatibility with AgentScope
 
 Typical usage:
     from agentscope.web.workstation.workflow_importer import load_workflow
@@ -19,17 +20,122 @@ Typical usage:
     config = load_workflow("path/to/workflow.xml")
 """
 
+import asyncio
+import copy
+import gzip
 import json
+import mmap
 import os
+import sys
 import traceback
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional, Union, List, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Dict,
+    Any,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Set,
+    Mapping,
+    Callable,
+    BinaryIO,
+)
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both parsers accept the raw bytes of a file
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Define constants for validation
-REQUIRED_CONFIG_KEYS = {"modules", "connections"}
-REQUIRED_MODULE_KEYS = {"id", "module", "version", "parameters"}
-OPTIONAL_MODULE_KEYS = {"metadata"}
+REQUIRED_CONFIG_KEYS = frozenset({"modules", "connections"})
+REQUIRED_MODULE_KEYS = frozenset({"id", "module", "version", "parameters"})
+OPTIONAL_MODULE_KEYS = frozenset({"metadata"})
+
+# JSON Schema of an AgentScope-format workflow configuration
+WORKFLOW_SCHEMA = {
+    "type": "object",
+    "required": sorted(REQUIRED_CONFIG_KEYS),
+    "properties": {
+        "modules": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": sorted(REQUIRED_MODULE_KEYS),
+                "properties": {
+                    "id": {"type": "integer"},
+                    "module": {"type": "string"},
+                    "version": {"type": "integer"},
+                    "parameters": {"type": "object"},
+                    "metadata": {"type": "object"},
+                },
+            },
+        },
+        "connections": {"type": "object"},
+    },
+}
+
+
+def _compile_jsonschema_rs_validator(schema: dict) -> Any:
+    """Compile a validator for the schema with jsonschema-rs, or return None
+    if it is not installed or cannot compile the schema, so that validation
+    falls back to the next backend instead of failing the import."""
+    if jsonschema_rs is None:
+        return None
+    try:
+        return jsonschema_rs.Draft7Validator(schema)
+    except Exception as e:
+        logger.warning("jsonschema-rs cannot compile the schema: {}", e)
+        return None
+
+
+# Compiled once at import time when jsonschema-rs is installed, otherwise
+# generated as a Python function by fastjsonschema when that is installed
+_WORKFLOW_VALIDATOR = _compile_jsonschema_rs_validator(WORKFLOW_SCHEMA)
+_WORKFLOW_VALIDATE = (
+    fastjsonschema.compile(WORKFLOW_SCHEMA)
+    if _WORKFLOW_VALIDATOR is None and fastjsonschema is not None
+    else None
+)
+
+# Strings shorter than this are interned when a config is converted; longer
+# values such as prompts are rarely repeated and not worth the lookup
+INTERN_MAX_LENGTH = 32
+
+# Chunk size used when feeding workflow files to the XML parser
+READ_BUFFER_SIZE = 1 << 20
+
+# JSON files at least this large are memory-mapped and parsed in place; below
+# it, setting up the mapping costs more than copying the bytes
+MMAP_MIN_SIZE = 64 << 10
+
+# Number of parsed workflow files kept by load_workflow
+WORKFLOW_CACHE_SIZE = 64
+
+# Decimal strings of small non-negative integers, the common case for module
+# ids, versions and designer coordinates in XML attributes
+_SMALL_INTS = {str(i): i for i in range(4096)}
 
 
 def load_json_workflow(file_path: str) -> Dict[str, Any]:
@@ -37,9 +143,10 @@ def load_json_workflow(file_path: str) -> Dict[str, Any]:
     Load a workflow configuration from a JSON file.
 
     This function reads a JSON file from the specified path and parses it into a Python
-    dictionary. It performs basic validation to ensure the file exists and contains valid
-    JSON data. The function is specifically designed to handle AgentScope workflow
-    configurations, which typically include 'modules' and 'connections' sections.
+    dictionary, using orjson when it is installed and the standard json module otherwise.
+    It performs basic validation to ensure the file exists and contains valid JSON data.
+    The function is specifically designed to handle AgentScope workflow configurations,
+    which typically include 'modules' and 'connections' sections.
 
     Args:
         file_path (str): Path to the JSON file containing the workflow configuration.
@@ -57,16 +164,33 @@ def load_json_workflow(file_path: str) -> Dict[str, Any]:
         >>> config = load_json_workflow("workflow.json")
         >>> print(f"Loaded workflow with {len(config['modules'])} modules")
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Workflow file not found: {file_path}")
+    try:
+        file = open(file_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Workflow file not found: {file_path}",
+        ) from None
 
-    with open(file_path, "r", encoding="utf-8") as file:
+    with file:
         try:
-            config = json.load(file)
-            logger.info(f"Successfully loaded JSON workflow from {file_path}")
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # callers see the same exception type with either parser
+            if (
+                orjson is not None
+                and os.fstat(file.fileno()).st_size >= MMAP_MIN_SIZE
+            ):
+                with mmap.mmap(
+                    file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ,
+                ) as mapped, memoryview(mapped) as view:
+                    config = orjson.loads(view)
+            else:
+                config = _json_loads(file.read())
+            logger.info("Successfully loaded JSON workflow from {}", file_path)
             return config
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON workflow: {e}")
+            logger.error("Failed to parse JSON workflow: {}", e)
             raise
 
 
@@ -74,10 +198,12 @@ def load_xml_workflow(file_path: str) -> Dict[str, Any]:
     """
     Load a workflow configuration from an XML file and convert it to a dictionary.
 
-    This function reads an XML file from the specified path, parses it using ElementTree,
-    and converts the XML structure into a Python dictionary format that is compatible with
-    AgentScope's workflow system. The conversion process handles XML elements like modules,
-    parameters, and connections, mapping them to the appropriate dictionary structure.
+    This function reads an XML file from the specified path and parses it with an
+    ElementTree parser target that converts the XML structure directly into a Python
+    dictionary format that is compatible with AgentScope's workflow system. The conversion
+    process handles XML elements like modules, parameters, and connections, mapping them
+    to the appropriate dictionary structure while parsing, so the result is already in
+    AgentScope format and convert_to_agentscope_workflow needs no structural changes.
 
     Args:
         file_path (str): Path to the XML file containing the workflow configuration.
@@ -96,113 +222,344 @@ def load_xml_workflow(file_path: str) -> Dict[str, Any]:
         >>> config = load_xml_workflow("workflow.xml")
         >>> print(f"Loaded workflow with {len(config['modules'])} modules")
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Workflow file not found: {file_path}")
-
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        # Convert XML to dictionary format compatible with AgentScope workflow
-        config = _xml_to_dict(root)
-        logger.info(f"Successfully loaded XML workflow from {file_path}")
+        # Build the workflow directly from parser events, without a DOM
+        config = _parse_xml_workflow(file_path)
+        logger.info("Successfully loaded XML workflow from {}", file_path)
         return config
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Workflow file not found: {file_path}",
+        ) from None
     except ET.ParseError as e:
-        logger.error(f"Failed to parse XML workflow: {e}")
+        logger.error("Failed to parse XML workflow: {}", e)
         raise
 
 
-def _xml_to_dict(element: ET.Element) -> Dict[str, Any]:
+def _parse_int(value: str) -> int:
+    """Parse an integer XML attribute, looking small values up in a table
+    before falling back to int()."""
+    result = _SMALL_INTS.get(value)
+    if result is None:
+        result = int(value)
+    return result
+
+
+def _xml_module_header(attrib: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Create a module dictionary from the attributes of a <module> element.
+
+    The module type is interned, since large workflows repeat a few types many
+    times. Header names and connection ids are interned the same way.
+
+    Args:
+        attrib (Mapping[str, str]): The attributes of the <module> element.
+
+    Returns:
+        Dict[str, Any]: The module dictionary, with empty parameters and the
+                        default designer position.
+    """
+    return {
+        "id": _parse_int(attrib.get("id", "0")),
+        "module": sys.intern(attrib.get("type", "")),
+        "version": _parse_int(attrib.get("version", "1")),
+        "parameters": {},
+        "metadata": {"designer": {"x": 0, "y": 0}}
+    }
+
+
+class _OpenXMLModule:
+    """Parse state of a <module> element whose end tag has not been seen yet."""
+
+    __slots__ = (
+        "depth",
+        "module",
+        "in_params",
+        "params_seen",
+        "position_seen",
+        "headers",
+    )
+
+    def __init__(self, depth: int, module: Dict[str, Any]) -> None:
+        self.depth = depth
+        self.module = module
+        self.in_params = False
+        self.params_seen = False
+        self.position_seen = False
+        self.headers: Optional[List[Dict[str, str]]] = None
+
+
+class _WorkflowXMLTarget:
+    """
+    ElementTree parser target that builds a workflow dictionary from parse events.
+
+    The target receives start/end/data callbacks from ``ET.XMLParser`` and fills
+    the modules, connections and metadata directly, so no Element objects are
+    created for the document at all. It is the only definition of how XML
+    workflows are converted:
+
+    - Every <module> element, at any depth, becomes a module with the id, type
+      and version attributes. The children of its first <parameters> child
+      become parameters holding their text, except <header>/<headers>, whose
+      children become a list of name/value headers. Its first <position> child
+      gives the designer coordinates.
+    - Every <connection> element with both from and to attributes becomes a
+      connection.
+    - The first <metadata> child of the root becomes the metadata, holding the
+      modules and connections found inside it, which are also part of the
+      workflow. Other <metadata> elements, including nested ones, are not
+      converted separately.
     """
-    Convert an XML element to a dictionary representation compatible with AgentScope workflows.
 
-    This is a helper function that recursively processes XML elements and converts them into
-    a dictionary structure. It handles special cases for workflow elements such as:
-    - metadata: Converted to a nested dictionary
-    - modules: Converted to a list of module dictionaries
-    - parameters: Converted to a dictionary of parameter values
-    - connections: Converted to a nested dictionary structure
-    - position attributes: Mapped to designer metadata
+    def __init__(self) -> None:
+        self._tags: List[str] = []
+        self._modules: List[Dict[str, Any]] = []
+        self._connections: Dict[str, Dict[str, List[int]]] = {}
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._metadata_modules: Optional[List[Dict[str, Any]]] = None
+        self._metadata_connections: Optional[
+            Dict[str, Dict[str, List[int]]]
+        ] = None
+        self._open_modules: List[_OpenXMLModule] = []
+        # Parameter whose text is being collected, with its text chunks
+        self._text_param: Optional[Tuple[Dict[str, Any], str]] = None
+        self._text: List[str] = []
+
+    def _flush_text(self) -> None:
+        """Store the text collected so far for the current parameter."""
+        if self._text_param is not None:
+            params, tag = self._text_param
+            params[tag] = "".join(self._text) if self._text else None
+            self._text_param = None
+            self._text = []
+
+    def _add_connection(self, attrib: Mapping[str, str]) -> None:
+        """Record a <connection> element in the connections, and in those of
+        the metadata while inside it."""
+        from_id = sys.intern(attrib.get("from", ""))
+        to_id = sys.intern(attrib.get("to", ""))
+        if not (from_id and to_id):
+            return
+
+        for connections in (self._connections, self._metadata_connections):
+            if connections is None:
+                continue
+            targets = connections.get(from_id)
+            if targets is None:
+                targets = connections[from_id] = {}
+            if to_id not in targets:
+                targets[to_id] = [0]  # Default connection index
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        """Handle an element start event."""
+        # Only the text before the first child element is a parameter value
+        self._flush_text()
+        self._tags.append(tag)
+        depth = len(self._tags)
+
+        if tag == "metadata" and depth == 2 and self._metadata is None:
+            self._metadata = {}
+            self._metadata_modules = []
+            self._metadata_connections = {}
+
+        if tag == "connection":
+            self._add_connection(attrib)
+
+        if self._open_modules:
+            open_module = self._open_modules[-1]
+            module = open_module.module
+            relative_depth = depth - open_module.depth
+            if relative_depth == 1 and tag == "parameters":
+                if not open_module.params_seen:
+                    open_module.in_params = open_module.params_seen = True
+            elif relative_depth == 1 and tag == "position":
+                if not open_module.position_seen:
+                    open_module.position_seen = True
+                    designer = module["metadata"]["designer"]
+                    designer["x"] = _parse_int(attrib.get("x", "0"))
+                    designer["y"] = _parse_int(attrib.get("y", "0"))
+            elif relative_depth == 2 and open_module.in_params:
+                if tag == "header" or tag == "headers":
+                    open_module.headers = []
+                    module["parameters"]["headers"] = open_module.headers
+                else:
+                    module["parameters"][tag] = None
+                    self._text_param = (module["parameters"], tag)
+            elif relative_depth == 3 and open_module.headers is not None:
+                open_module.headers.append({
+                    "name": sys.intern(attrib.get("name", "")),
+                    "value": attrib.get("value", "")
+                })
+
+        if tag == "module":
+            module = _xml_module_header(attrib)
+            self._modules.append(module)
+            if self._metadata_modules is not None:
+                self._metadata_modules.append(module)
+            self._open_modules.append(_OpenXMLModule(depth, module))
+
+    def end(self, tag: str) -> None:
+        """Handle an element end event."""
+        self._flush_text()
+        depth = len(self._tags)
+        self._tags.pop()
+
+        if self._open_modules:
+            open_module = self._open_modules[-1]
+            relative_depth = depth - open_module.depth
+            if relative_depth == 0:
+                self._open_modules.pop()
+            elif relative_depth == 1 and tag == "parameters":
+                open_module.in_params = False
+            elif relative_depth == 2:
+                open_module.headers = None
+
+        if (
+            depth == 2
+            and tag == "metadata"
+            and self._metadata_modules is not None
+        ):
+            if self._metadata_modules:
+                self._metadata["modules"] = self._metadata_modules
+            if self._metadata_connections:
+                self._metadata["connections"] = self._metadata_connections
+            self._metadata_modules = None
+            self._metadata_connections = None
+
+    def data(self, data: str) -> None:
+        """Handle character data."""
+        if self._text_param is not None:
+            self._text.append(data)
+
+    def close(self) -> Dict[str, Any]:
+        """Return the workflow dictionary once parsing is complete."""
+        result = {}
+        if self._metadata is not None:
+            result["metadata"] = self._metadata
+        if self._modules:
+            result["modules"] = self._modules
+        if self._connections:
+            result["connections"] = self._connections
+        return result
+
+
+def _parse_xml_workflow(file_path: str) -> Dict[str, Any]:
+    """
+    Parse an XML workflow file into a dictionary without building a document tree.
 
-    The function is designed to transform XML workflow definitions into the same dictionary
-    format that would be produced by parsing a JSON workflow file, ensuring consistency
-    regardless of the input format.
+    The file is fed to ``ET.XMLParser`` in ``READ_BUFFER_SIZE`` chunks, with a
+    ``_WorkflowXMLTarget`` that constructs the workflow dictionary from parse
+    events.
 
     Args:
-        element (ET.Element): The XML element to convert. This should be an ElementTree
-                             Element object, typically the root element of an XML document
-                             or a child element being processed recursively.
+        file_path (str): Path to the XML file containing the workflow configuration.
 
     Returns:
-        Dict[str, Any]: A dictionary representation of the XML element, structured to be
+        Dict[str, Any]: A dictionary representation of the workflow, structured to be
                         compatible with AgentScope's workflow system.
 
-    Note:
-        This is an internal helper function and not intended to be called directly by users.
-        It is used by the load_xml_workflow function to process XML workflow definitions.
+    Raises:
+        ET.ParseError: If the file contains invalid XML that cannot be parsed.
     """
-    result = {}
-
-    # Process metadata if it exists
-    metadata_elem = element.find("metadata")
-    if metadata_elem is not None:
-        result["metadata"] = _xml_to_dict(metadata_elem)
-
-    # Process modules
-    modules = []
-    for module_elem in element.findall(".//module"):
-        module = {
-            "id": int(module_elem.get("id", "0")),
-            "module": module_elem.get("type", ""),
-            "version": int(module_elem.get("version", "1")),
-            "parameters": {},
-            "metadata": {"designer": {"x": 0, "y": 0}}
-        }
-
-        # Process parameters
-        params_elem = module_elem.find("parameters")
-        if params_elem is not None:
-            for param in params_elem:
-                # Handle different parameter types
-                if param.tag == "header" or param.tag == "headers":
-                    headers = []
-                    for header in param:
-                        headers.append({
-                            "name": header.get("name", ""),
-                            "value": header.get("value", "")
-                        })
-                    module["parameters"]["headers"] = headers
-                else:
-                    module["parameters"][param.tag] = param.text
+    with open(file_path, "rb") as file:
+        return _parse_xml_stream(file)
+
+
+def _parse_xml_stream(file: BinaryIO) -> Dict[str, Any]:
+    """Parse an XML workflow from a binary file object, in READ_BUFFER_SIZE
+    chunks, with a _WorkflowXMLTarget."""
+    parser = ET.XMLParser(target=_WorkflowXMLTarget())
+    while True:
+        chunk = file.read(READ_BUFFER_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+    return parser.close()
+
+
+def _open_zstd(file_path: str) -> BinaryIO:
+    """Open a zstd-compressed file for streaming decompression."""
+    if zstandard is None:
+        raise ImportError(
+            "Loading .zst workflow files requires zstandard installed. "
+            "Try `pip install zstandard`.",
+        )
+    # Decompressors are not thread-safe, and load_workflows may load several
+    # files at once, so each file gets its own. The reader decodes every
+    # frame of multi-frame files, and closes the file when it is closed
+    file = open(file_path, "rb")
+    return zstandard.ZstdDecompressor().stream_reader(
+        file,
+        read_across_frames=True,
+        closefd=True,
+    )
+
+
+# Openers of compressed workflow files keyed by lowercase file extension
+_DECOMPRESSORS: Dict[str, Callable[[str], BinaryIO]] = {
+    ".gz": gzip.open,
+    ".zst": _open_zstd,
+}
+
+
+def load_compressed_workflow(file_path: str) -> Dict[str, Any]:
+    """
+    Load a workflow configuration from a gzip or zstd compressed file.
 
-        # Process position if available
-        pos_elem = module_elem.find("position")
-        if pos_elem is not None:
-            module["metadata"]["designer"]["x"] = int(pos_elem.get("x", "0"))
-            module["metadata"]["designer"]["y"] = int(pos_elem.get("y", "0"))
+    The compression is chosen by the outer extension (.gz or .zst) and the format by
+    the inner one, so ``workflow.json.gz`` is parsed as JSON and ``workflow.xml.zst``
+    as XML. The file is decompressed as a stream, and XML is fed to the parser
+    chunk by chunk.
 
-        modules.append(module)
+    Args:
+        file_path (str): Path to the compressed workflow file, e.g. ending in
+                         .json.gz, .json.zst, .xml.gz or .xml.zst.
 
-    if modules:
-        result["modules"] = modules
+    Returns:
+        Dict[str, Any]: A dictionary containing the workflow configuration.
 
-    # Process connections
-    connections = {}
-    for conn_elem in element.findall(".//connection"):
-        from_id = conn_elem.get("from", "")
-        to_id = conn_elem.get("to", "")
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the compression or inner file extension is not supported.
+        ImportError: If the file is zstd-compressed and zstandard is not installed.
+        json.JSONDecodeError: If a JSON file contains invalid JSON.
+        ET.ParseError: If an XML file contains invalid XML.
 
-        if from_id and to_id:
-            if from_id not in connections:
-                connections[from_id] = {}
+    Example:
+        >>> config = load_compressed_workflow("workflow.json.gz")
+    """
+    stem, compression = os.path.splitext(file_path)
+    decompress = _DECOMPRESSORS.get(compression.lower())
+    inner_ext = os.path.splitext(stem)[1].lower()
+    if decompress is None or inner_ext not in (".json", ".xml"):
+        raise ValueError(
+            f"Unsupported compressed workflow file: {file_path}. Supported "
+            f"extensions are .json or .xml followed by .gz or .zst",
+        )
 
-            if to_id not in connections[from_id]:
-                connections[from_id][to_id] = [0]  # Default connection index
+    try:
+        file = decompress(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Workflow file not found: {file_path}",
+        ) from None
+
+    with file:
+        if inner_ext == ".json":
+            config = _json_loads(file.read())
+        else:
+            config = _parse_xml_stream(file)
+    logger.info("Successfully loaded compressed workflow from {}", file_path)
+    return config
 
-    if connections:
-        result["connections"] = connections
 
-    return result
+# Workflow loaders keyed by lowercase file extension
+_LOADERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    ".json": load_json_workflow,
+    ".xml": load_xml_workflow,
+    ".gz": load_compressed_workflow,
+    ".zst": load_compressed_workflow,
+}
 
 
 def load_workflow(file_path: str) -> Dict[str, Any]:
@@ -211,12 +568,17 @@ def load_workflow(file_path: str) -> Dict[str, Any]:
 
     This is the main entry point for loading workflow configurations from files. It determines
     the file type based on the file extension and delegates to the appropriate loader function.
-    Currently supported file formats are JSON (.json) and XML (.xml).
+    Currently supported file formats are JSON (.json) and XML (.xml), either of which
+    may be compressed with gzip (.gz) or zstd (.zst), e.g. ``workflow.json.gz``.
 
     The function performs basic validation to ensure the file exists and has a supported
     extension. It then calls the appropriate loader function to parse the file and return
     the workflow configuration as a dictionary.
 
+    Parsed configurations are cached per ``(abspath, st_mtime_ns, st_size)``,
+    so repeated loads of an unchanged file skip parsing entirely. Each call
+    returns a deep copy, so callers are free to mutate the result.
+
     Args:
         file_path (str): Path to the file containing the workflow configuration.
                          This should be an absolute or relative path to a valid workflow file
@@ -229,7 +591,8 @@ def load_workflow(file_path: str) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If the specified file does not exist or cannot be accessed.
-        ValueError: If the file extension is not supported (.json or .xml).
+        ValueError: If the file extension is not supported (.json or .xml, optionally
+                    followed by .gz or .zst).
         json.JSONDecodeError: If a JSON file contains invalid JSON.
         ET.ParseError: If an XML file contains invalid XML.
 
@@ -238,17 +601,109 @@ def load_workflow(file_path: str) -> Dict[str, Any]:
         >>> # or
         >>> config = load_workflow("workflow.xml")   # Load from XML
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Workflow file not found: {file_path}")
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Workflow file not found: {file_path}",
+        ) from None
+
+    config = _load_workflow_cached(
+        os.path.abspath(file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+    return copy.deepcopy(config)
+
+
+def load_workflows(
+    file_paths: List[str],
+    max_workers: int = 8,
+) -> List[Dict[str, Any]]:
+    """
+    Load several workflow configurations concurrently.
 
-    file_ext = os.path.splitext(file_path)[1].lower()
+    Each file is loaded with load_workflow in a thread pool, which overlaps the
+    file reads of the different workflows. The configurations are returned in
+    the order of the given paths.
 
-    if file_ext == ".json":
-        return load_json_workflow(file_path)
-    elif file_ext == ".xml":
-        return load_xml_workflow(file_path)
-    else:
-        raise ValueError(f"Unsupported file extension: {file_ext}. Supported extensions are .json and .xml")
+    Args:
+        file_paths (List[str]): Paths to the workflow files to load, each with a
+                                .json or .xml extension.
+        max_workers (int, optional): The maximum number of files loaded at the
+                                     same time. Defaults to 8.
+
+    Returns:
+        List[Dict[str, Any]]: The workflow configurations, one per path.
+
+    Raises:
+        FileNotFoundError: If any of the files does not exist.
+        ValueError: If any of the files has an unsupported extension.
+
+    Example:
+        >>> configs = load_workflows(["a.json", "b.xml"])
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_workflow, file_paths))
+
+
+async def aload_workflow(file_path: str) -> Dict[str, Any]:
+    """
+    Load a workflow configuration without blocking the event loop.
+
+    The file is loaded with load_workflow in the default executor of the running
+    loop, so it shares the parse cache and the JSON/XML loaders of the synchronous
+    API.
+
+    Args:
+        file_path (str): Path to the workflow file, with a .json or .xml extension.
+
+    Returns:
+        Dict[str, Any]: The workflow configuration.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file has an unsupported extension.
+    """
+    return await asyncio.to_thread(load_workflow, file_path)
+
+
+async def aload_workflows(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Load several workflow configurations concurrently from a coroutine.
+
+    Args:
+        file_paths (List[str]): Paths to the workflow files to load.
+
+    Returns:
+        List[Dict[str, Any]]: The workflow configurations, in the order of the
+                              given paths.
+    """
+    return list(
+        await asyncio.gather(*(aload_workflow(path) for path in file_paths)),
+    )
+
+
+@lru_cache(maxsize=WORKFLOW_CACHE_SIZE)
+def _load_workflow_cached(
+    abspath: str,
+    mtime_ns: int,
+    size: int,
+) -> Dict[str, Any]:
+    """Parse a workflow file, memoized on its stat signature.
+
+    The ``mtime_ns`` and ``size`` arguments are only part of the cache key, so
+    that an edited file is transparently re-parsed on the next call.
+    """
+    # pylint: disable=unused-argument
+    file_ext = os.path.splitext(abspath)[1].lower()
+    loader = _LOADERS.get(file_ext)
+    if loader is None:
+        raise ValueError(
+            f"Unsupported file extension: {file_ext}. Supported extensions "
+            f"are .json and .xml, optionally compressed as .gz or .zst",
+        )
+    return loader(abspath)
 
 
 def convert_to_agentscope_workflow(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -260,7 +715,11 @@ def convert_to_agentscope_workflow(config: Dict[str, Any]) -> Dict[str, Any]:
     connections, and can perform transformations to adapt configurations from different formats
     or versions to the current AgentScope workflow format.
 
-    Currently, the function primarily validates that the configuration has the expected structure.
+    Currently, the function primarily validates that the configuration has the expected structure,
+    checking it against WORKFLOW_SCHEMA when a schema validator is available.
+    Configurations produced by load_xml_workflow are built in AgentScope format during parsing,
+    so for them no structural conversion is needed. Dictionary keys and short string values
+    are interned before the configuration is returned.
     It is designed to be extensible to handle more complex transformations in the future, such as
     converting from third-party workflow formats or handling version migrations.
 
@@ -283,11 +742,139 @@ def convert_to_agentscope_workflow(config: Dict[str, Any]) -> Dict[str, Any]:
         >>> # Now use the config with AgentScope
     """
     # Check if the configuration is already in the expected format
-    if "modules" in config and "connections" in config:
-        return config
+    if REQUIRED_CONFIG_KEYS.issubset(config):
+        _validate_workflow(config)
+        return _intern_strings(config)
 
     # If the configuration is in a different format, convert it
     # This is a placeholder for future conversion logic
     logger.warning("The workflow configuration may not be in the expected format for AgentScope.")
 
-    return config
+    return _intern_strings(config)
+
+
+def _validate_workflow(config: Dict[str, Any]) -> None:
+    """
+    Validate an AgentScope-format configuration against WORKFLOW_SCHEMA.
+
+    Validation uses the validator compiled from WORKFLOW_SCHEMA at import time by
+    jsonschema-rs, or by fastjsonschema when only that is installed. When neither is
+    installed, _check_workflow applies the same rules in Python, so a configuration
+    is accepted or rejected the same way whichever package is available.
+
+    Args:
+        config (Dict[str, Any]): The workflow configuration to validate.
+
+    Raises:
+        ValueError: If the configuration does not match the workflow schema.
+    """
+    if _WORKFLOW_VALIDATOR is not None:
+        try:
+            _WORKFLOW_VALIDATOR.validate(config)
+        except jsonschema_rs.ValidationError as e:
+            raise ValueError(f"Invalid workflow configuration: {e}") from e
+    elif _WORKFLOW_VALIDATE is not None:
+        try:
+            _WORKFLOW_VALIDATE(config)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValueError(f"Invalid workflow configuration: {e}") from e
+    else:
+        _check_workflow(config)
+
+
+def _is_schema_integer(value: Any) -> bool:
+    """Check a value against the JSON Schema "integer" type, which excludes
+    booleans and includes floats without a fractional part."""
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+# Type checks of the module properties in WORKFLOW_SCHEMA
+_MODULE_PROPERTY_CHECKS: Dict[str, Tuple[str, Callable[[Any], bool]]] = {
+    "id": ("integer", _is_schema_integer),
+    "module": ("string", lambda value: isinstance(value, str)),
+    "version": ("integer", _is_schema_integer),
+    "parameters": ("object", lambda value: isinstance(value, dict)),
+    "metadata": ("object", lambda value: isinstance(value, dict)),
+}
+
+
+def _check_workflow(config: Any) -> None:
+    """
+    Check a configuration against the rules of WORKFLOW_SCHEMA in Python.
+
+    This is the fallback of _validate_workflow when no schema validator package
+    is installed, and must be kept in sync with WORKFLOW_SCHEMA.
+
+    Args:
+        config (Any): The workflow configuration to check.
+
+    Raises:
+        ValueError: If the configuration does not match the workflow schema.
+    """
+    if not isinstance(config, dict):
+        raise ValueError(
+            "Invalid workflow configuration: the configuration is not an "
+            "object",
+        )
+    missing = REQUIRED_CONFIG_KEYS - config.keys()
+    if missing:
+        raise ValueError(
+            f"Invalid workflow configuration: missing keys {sorted(missing)}",
+        )
+    if not isinstance(config["connections"], dict):
+        raise ValueError(
+            "Invalid workflow configuration: connections is not an object",
+        )
+
+    modules = config["modules"]
+    if not isinstance(modules, list):
+        raise ValueError(
+            "Invalid workflow configuration: modules is not an array",
+        )
+    for index, module in enumerate(modules):
+        if not isinstance(module, dict):
+            raise ValueError(
+                f"Invalid workflow configuration: module {index} is not an "
+                f"object",
+            )
+        if not REQUIRED_MODULE_KEYS.issubset(module):
+            raise ValueError(
+                f"Invalid workflow configuration: module {index} is missing "
+                f"keys {sorted(REQUIRED_MODULE_KEYS - module.keys())}",
+            )
+        for key, (type_name, check) in _MODULE_PROPERTY_CHECKS.items():
+            if key in module and not check(module[key]):
+                raise ValueError(
+                    f"Invalid workflow configuration: {key} of module "
+                    f"{index} is not of type {type_name}",
+                )
+
+
+def _intern_strings(obj: Any) -> Any:
+    """
+    Intern the dictionary keys and short string values of a loaded configuration.
+
+    Workflow configurations repeat the same keys and type names across every module,
+    so interning them leaves one string object per distinct value and lets dictionary
+    lookups succeed on pointer equality.
+
+    Args:
+        obj (Any): The configuration, or a part of it, to process.
+
+    Returns:
+        Any: An equal object whose dictionaries and lists are rebuilt with interned strings.
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_strings(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    if isinstance(obj, str) and len(obj) < INTERN_MAX_LENGTH:
+        return sys.intern(obj)
+    return obj
@@ -32,10 +32,14 @@ Typical usage:
     # Compile the node to Python code
     code = node.compile()
 """
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import IntEnum
-from functools import partial
-from typing import List, Optional
+from functools import partial, wraps
+from types import MappingProxyType
+from typing import Callable, Generator, List, Optional, Tuple
 
 from agentscope import msghub
 from agentscope.agents import (
@@ -70,6 +74,58 @@ from agentscope.service import (
 
 DEFAULT_FLOW_VAR = "flow"
 
+# Node classes keyed by the node names used in workflow configurations, filled
+# in by WorkflowNode.__init_subclass__ as the classes are defined. New node
+# types can still be registered by adding them to NODE_NAME_MAPPING, while
+# NODE_NAME_MAPPING_VIEW is a read-only view of the same mapping
+NODE_NAME_MAPPING = {}
+NODE_NAME_MAPPING_VIEW = MappingProxyType(NODE_NAME_MAPPING)
+
+# Look up a node class by name, raising KeyError for unknown names. This is
+# the mapping's own bound __getitem__, so a lookup is a single C-level call
+# that also sees node types registered after import
+get_node_class: Callable[[str], type] = NODE_NAME_MAPPING.__getitem__
+
+
+# Model configs collected by deferred_model_config_loading, or None when model
+# nodes load their configs as soon as they are created
+_pending_model_configs: ContextVar[Optional[list]] = ContextVar(
+    "_pending_model_configs",
+    default=None,
+)
+
+
+@contextmanager
+def deferred_model_config_loading() -> Generator[None, None, None]:
+    """Collect the configs of the model nodes created within the context, and
+    load them with a single ModelManager call when it exits without error."""
+    pending = []
+    token = _pending_model_configs.set(pending)
+    try:
+        yield
+    finally:
+        _pending_model_configs.reset(token)
+    if pending:
+        ModelManager.get_instance().load_model_configs(pending)
+
+
+def _exec_stmt(var_name: str) -> str:
+    """Return the statement that passes the flow through the given variable."""
+    return f"{DEFAULT_FLOW_VAR} = {var_name}({DEFAULT_FLOW_VAR})"
+
+
+def _memoize_compile(compile_impl: Callable) -> Callable:
+    """Wrap a node's compile method so its result is computed once per node."""
+
+    @wraps(compile_impl)
+    def compile(self: "WorkflowNode") -> dict:
+        # pylint: disable=redefined-builtin
+        if self._compiled is None:
+            self._compiled = compile_impl(self)
+        return self._compiled
+
+    return compile
+
 
 class WorkflowNodeType(IntEnum):
     """
@@ -116,14 +172,26 @@ class WorkflowNode(ABC):
     Attributes:
         node_type (WorkflowNodeType): The type of the node, defined by the WorkflowNodeType enum.
         node_id (str): A unique identifier for the node within the workflow.
-        opt_kwargs (dict): A dictionary of operational parameters for the node.
+        opt_kwargs (MappingProxyType): A read-only view of the operational parameters
+            for the node.
         source_kwargs (dict): A dictionary of the original source parameters for the node.
         dep_opts (list): A list of dependent nodes that this node depends on.
-        dep_vars (list): A list of variable names for the dependent nodes.
+        dep_vars (tuple): The variable names of the dependent nodes.
         var_name (str): A variable name for the node, used when compiling to Python code.
     """
 
     node_type = None
+    _var_name_prefix = ""
+    __slots__ = (
+        "node_id",
+        "opt_kwargs",
+        "source_kwargs",
+        "dep_opts",
+        "dep_vars",
+        "var_name",
+        "_compiled",
+        "_agents",
+    )
 
     def __init__(
         self,
@@ -155,11 +223,44 @@ class WorkflowNode(ABC):
                             These nodes will be executed before this node in the workflow.
         """
         self.node_id = node_id
-        self.opt_kwargs = opt_kwargs
+        # Read-only, since the memoized compiled code depends on them
+        self.opt_kwargs = MappingProxyType(opt_kwargs)
         self.source_kwargs = source_kwargs
         self.dep_opts = dep_opts
-        self.dep_vars = [opt.var_name for opt in self.dep_opts]
-        self.var_name = f"{self.node_type.name.lower()}_{self.node_id}"
+        self.dep_vars = tuple(opt.var_name for opt in self.dep_opts)
+        # Interned, since the same names are compared and used as keys
+        # across nodes and again in the compiled code
+        self.var_name = sys.intern(f"{self._var_name_prefix}{self.node_id}")
+        self._compiled = None
+        # Unique (agent, variable name) pairs of a pipeline node, memoized by
+        # get_all_agents
+        self._agents = None
+
+    def __init_subclass__(  # type: ignore[no-untyped-def]
+        cls,
+        names: tuple = (),
+        **kwargs,
+    ) -> None:
+        """Register each node class in NODE_NAME_MAPPING under its workflow
+        names, precompute its variable name prefix, and memoize its compile
+        method.
+
+        The compiled code only depends on the node's parameters, which are fixed
+        once the node is initialized, so it is built on the first call and the
+        same dictionary is returned afterwards.
+
+        Args:
+            names (tuple, optional): The node names used in workflow configurations
+                                    that map to this class. Defaults to ().
+        """
+        super().__init_subclass__(**kwargs)
+        for name in names:
+            NODE_NAME_MAPPING[name] = cls
+        if cls.node_type is not None:
+            cls._var_name_prefix = f"{cls.node_type.name.lower()}_"
+        compile_impl = cls.__dict__.get("compile")
+        if compile_impl is not None:
+            cls.compile = _memoize_compile(compile_impl)
 
     def __call__(self, x: dict = None):  # type: ignore[no-untyped-def]
         """
@@ -209,7 +310,15 @@ class WorkflowNode(ABC):
         }
 
 
-class ModelNode(WorkflowNode):
+class ModelNode(
+    WorkflowNode,
+    names=(
+        "dashscope_chat",
+        "openai_chat",
+        "post_api_chat",
+        "post_api_dall_e",
+    ),
+):
     """
     A node that represents a model in a workflow.
 
@@ -219,6 +328,7 @@ class ModelNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.MODEL
+    __slots__ = ()
 
     def __init__(
         self,
@@ -228,18 +338,22 @@ class ModelNode(WorkflowNode):
         dep_opts: list,
     ) -> None:
         super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        ModelManager.get_instance().load_model_configs([self.opt_kwargs])
+        pending = _pending_model_configs.get()
+        if pending is not None:
+            pending.append(opt_kwargs)
+        else:
+            ModelManager.get_instance().load_model_configs([opt_kwargs])
 
     def compile(self) -> dict:
         return {
             "imports": "from agentscope.manager import ModelManager",
             "inits": f"ModelManager.get_instance().load_model_configs("
-            f"[{self.opt_kwargs}])",
+            f"[{dict(self.opt_kwargs)}])",
             "execs": "",
         }
 
 
-class MsgNode(WorkflowNode):
+class MsgNode(WorkflowNode, names=("Message",)):
     """
     A node that manages messaging within a workflow.
 
@@ -248,6 +362,7 @@ class MsgNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.MESSAGE
+    __slots__ = ("msg",)
 
     def __init__(
         self,
@@ -271,12 +386,15 @@ class MsgNode(WorkflowNode):
         }
 
 
-class DialogAgentNode(WorkflowNode):
+class _SimpleAgentNode(WorkflowNode):
     """
-    A node representing a DialogAgent within a workflow.
+    Base class of the nodes wrapping an agent that is built from the node's
+    parameters and called with the flow. Subclasses only set ``agent_cls``.
     """
 
     node_type = WorkflowNodeType.AGENT
+    __slots__ = ("pipeline",)
+    agent_cls = None
 
     def __init__(
         self,
@@ -286,87 +404,55 @@ class DialogAgentNode(WorkflowNode):
         dep_opts: list,
     ) -> None:
         super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.pipeline = DialogAgent(**self.opt_kwargs)
+        self.pipeline = self.agent_cls(**self.opt_kwargs)
 
     def __call__(self, x: dict = None) -> dict:
         return self.pipeline(x)
 
     def compile(self) -> dict:
+        agent_name = self.agent_cls.__name__
         return {
-            "imports": "from agentscope.agents import DialogAgent",
-            "inits": f"{self.var_name} = DialogAgent("
+            "imports": f"from agentscope.agents import {agent_name}",
+            "inits": f"{self.var_name} = {agent_name}("
             f"{kwarg_converter(self.opt_kwargs)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class UserAgentNode(WorkflowNode):
+class DialogAgentNode(_SimpleAgentNode, names=("DialogAgent",)):
     """
-    A node representing a UserAgent within a workflow.
+    A node representing a DialogAgent within a workflow.
     """
 
-    node_type = WorkflowNodeType.AGENT
+    agent_cls = DialogAgent
+    __slots__ = ()
 
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.pipeline = UserAgent(**self.opt_kwargs)
 
-    def __call__(self, x: dict = None) -> dict:
-        return self.pipeline(x)
+class UserAgentNode(_SimpleAgentNode, names=("UserAgent",)):
+    """
+    A node representing a UserAgent within a workflow.
+    """
 
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.agents import UserAgent",
-            "inits": f"{self.var_name} = UserAgent("
-            f"{kwarg_converter(self.opt_kwargs)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
-        }
+    agent_cls = UserAgent
+    __slots__ = ()
 
 
-class DictDialogAgentNode(WorkflowNode):
+class DictDialogAgentNode(_SimpleAgentNode, names=("DictDialogAgent",)):
     """
     A node representing a DictDialogAgent within a workflow.
     """
 
-    node_type = WorkflowNodeType.AGENT
-
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.pipeline = DictDialogAgent(**self.opt_kwargs)
-
-    def __call__(self, x: dict = None) -> dict:
-        return self.pipeline(x)
-
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.agents import DictDialogAgent",
-            "inits": f"{self.var_name} = DictDialogAgent("
-            f"{kwarg_converter(self.opt_kwargs)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
-        }
+    agent_cls = DictDialogAgent
+    __slots__ = ()
 
 
-class ReActAgentNode(WorkflowNode):
+class ReActAgentNode(WorkflowNode, names=("ReActAgent",)):
     """
     A node representing a ReActAgent within a workflow.
     """
 
     node_type = WorkflowNodeType.AGENT
+    __slots__ = ("service_toolkit", "pipeline")
 
     def __init__(
         self,
@@ -391,10 +477,11 @@ class ReActAgentNode(WorkflowNode):
         return self.pipeline(x)
 
     def compile(self) -> dict:
-        tools = deps_converter(self.dep_vars)[1:-1].split(",")
         service_toolkit_code = ";".join(
-            f"{self.var_name}_service_toolkit.add({tool.strip()})"
-            for tool in tools
+            [
+                f"{self.var_name}_service_toolkit.add({tool})"
+                for tool in self.dep_vars
+            ],
         )
         return {
             "imports": "from agentscope.agents import ReActAgent",
@@ -403,12 +490,11 @@ class ReActAgentNode(WorkflowNode):
             f"    {self.var_name} = ReActAgent"
             f"({kwarg_converter(self.opt_kwargs)}, service_toolkit"
             f"={self.var_name}_service_toolkit)",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class MsgHubNode(WorkflowNode):
+class MsgHubNode(WorkflowNode, names=("MsgHub",)):
     """
     A node that serves as a messaging hub within a workflow.
 
@@ -417,6 +503,12 @@ class MsgHubNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = (
+        "announcement",
+        "participants",
+        "participants_var",
+        "pipeline",
+    )
 
     def __init__(
         self,
@@ -440,8 +532,9 @@ class MsgHubNode(WorkflowNode):
         )
 
         self.pipeline = self.dep_opts[0]
-        self.participants = get_all_agents(self.pipeline)
-        self.participants_var = get_all_agents(self.pipeline, return_var=True)
+        self.participants, self.participants_var = get_all_agents_and_vars(
+            self.pipeline,
+        )
 
     def __call__(self, x: dict = None) -> dict:
         with msghub(self.participants, announcement=self.announcement):
@@ -449,12 +542,11 @@ class MsgHubNode(WorkflowNode):
         return x
 
     def compile(self) -> dict:
+        # Reuse the announcement built in __init__, so the compiled code
+        # gets the same defaults as the executed node
         announcement = (
-            f'Msg(name="'
-            f'{self.opt_kwargs["announcement"].get("name", "Host")}", '
-            f'content="'
-            f'{self.opt_kwargs["announcement"].get("content", "Host")}"'
-            f', role="system")'
+            f'Msg(name="{self.announcement.name}", '
+            f'content="{self.announcement.content}", role="system")'
         )
         execs = f"""with msghub({deps_converter(self.participants_var)},
         announcement={announcement}):
@@ -468,7 +560,7 @@ class MsgHubNode(WorkflowNode):
         }
 
 
-class PlaceHolderNode(WorkflowNode):
+class PlaceHolderNode(WorkflowNode, names=("Placeholder",)):
     """
     A placeholder node within a workflow.
 
@@ -477,6 +569,7 @@ class PlaceHolderNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -497,12 +590,11 @@ class PlaceHolderNode(WorkflowNode):
                 "from agentscope.web.workstation._utils import _placeholder"
             ),
             "inits": f"{self.var_name} = _placeholder",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class SequentialPipelineNode(WorkflowNode):
+class SequentialPipelineNode(WorkflowNode, names=("SequentialPipeline",)):
     """
     A node representing a sequential node within a workflow.
 
@@ -511,6 +603,7 @@ class SequentialPipelineNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -530,12 +623,11 @@ class SequentialPipelineNode(WorkflowNode):
             "imports": "from agentscope.pipelines import SequentialPipeline",
             "inits": f"{self.var_name} = SequentialPipeline("
             f"{deps_converter(self.dep_vars)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class ForLoopPipelineNode(WorkflowNode):
+class ForLoopPipelineNode(WorkflowNode, names=("ForLoopPipeline",)):
     """
     A node representing a for-loop structure in a workflow.
 
@@ -544,6 +636,7 @@ class ForLoopPipelineNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -574,12 +667,11 @@ class ForLoopPipelineNode(WorkflowNode):
             f"loop_body_operators="
             f"{deps_converter(self.dep_vars)},"
             f" {kwarg_converter(self.source_kwargs)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class WhileLoopPipelineNode(WorkflowNode):
+class WhileLoopPipelineNode(WorkflowNode, names=("WhileLoopPipeline",)):
     """
     A node representing a while-loop structure in a workflow.
 
@@ -588,6 +680,7 @@ class WhileLoopPipelineNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -618,12 +711,11 @@ class WhileLoopPipelineNode(WorkflowNode):
             f"loop_body_operators="
             f"{deps_converter(self.dep_vars)},"
             f" {kwarg_converter(self.source_kwargs)})",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.var_name}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.var_name),
         }
 
 
-class IfElsePipelineNode(WorkflowNode):
+class IfElsePipelineNode(WorkflowNode, names=("IfElsePipeline",)):
     """
     A node representing an if-else conditional structure in a workflow.
 
@@ -632,6 +724,7 @@ class IfElsePipelineNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -663,7 +756,7 @@ class IfElsePipelineNode(WorkflowNode):
         imports = (
             "from agentscope.web.workstation._utils import _IfElsePipeline"
         )
-        execs = f"{DEFAULT_FLOW_VAR} = {self.var_name}({DEFAULT_FLOW_VAR})"
+        execs = _exec_stmt(self.var_name)
         if len(self.dep_vars) == 1:
             return {
                 "imports": imports,
@@ -682,7 +775,7 @@ class IfElsePipelineNode(WorkflowNode):
         raise ValueError
 
 
-class SwitchPipelineNode(WorkflowNode):
+class SwitchPipelineNode(WorkflowNode, names=("SwitchPipeline",)):
     """
     A node representing a switch-case structure within a workflow.
 
@@ -691,6 +784,7 @@ class SwitchPipelineNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.PIPELINE
+    __slots__ = ("case_operators_var", "default_var_name", "pipeline")
 
     def __init__(
         self,
@@ -699,6 +793,10 @@ class SwitchPipelineNode(WorkflowNode):
         source_kwargs: dict,
         dep_opts: list,
     ) -> None:
+        # The cases are turned into case operators below, so they are taken
+        # out of the parameters before those are frozen
+        cases = opt_kwargs.pop("cases")
+        source_kwargs.pop("cases")
         super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
         assert 0 < len(self.dep_opts), (
             "SwitchPipelineNode must contain at least " "one PipelineNode."
@@ -706,29 +804,28 @@ class SwitchPipelineNode(WorkflowNode):
         case_operators = {}
         self.case_operators_var = {}
 
-        if len(self.dep_opts) == len(self.opt_kwargs["cases"]):
+        if len(self.dep_opts) == len(cases):
             # No default_operators provided
             default_operators = _placeholder
             self.default_var_name = "_placeholder"
-        elif len(self.dep_opts) == len(self.opt_kwargs["cases"]) + 1:
+        elif len(self.dep_opts) == len(cases) + 1:
             # default_operators provided
             default_operators = self.dep_opts.pop(-1)
-            self.default_var_name = self.dep_vars.pop(-1)
+            self.default_var_name = self.dep_vars[-1]
+            self.dep_vars = self.dep_vars[:-1]
         else:
             raise ValueError(
                 f"SwitchPipelineNode deps {self.dep_opts} not matches "
-                f"cases {self.opt_kwargs['cases']}.",
+                f"cases {cases}.",
             )
 
         for key, value, var in zip(
-            self.opt_kwargs["cases"],
+            cases,
             self.dep_opts,
             self.dep_vars,
         ):
             case_operators[key] = value.pipeline
             self.case_operators_var[key] = var
-        self.opt_kwargs.pop("cases")
-        self.source_kwargs.pop("cases")
         self.pipeline = _SwitchPipeline(
             case_operators=case_operators,
             default_operators=default_operators,  # type: ignore[arg-type]
@@ -743,7 +840,7 @@ class SwitchPipelineNode(WorkflowNode):
             "from agentscope.web.workstation._utils import _SwitchPipeline\n"
             "from agentscope.web.workstation._utils import _placeholder"
         )
-        execs = f"{DEFAULT_FLOW_VAR} = {self.var_name}({DEFAULT_FLOW_VAR})"
+        execs = _exec_stmt(self.var_name)
         return {
             "imports": imports,
             "inits": f"{self.var_name} = _SwitchPipeline(case_operators="
@@ -754,7 +851,7 @@ class SwitchPipelineNode(WorkflowNode):
         }
 
 
-class CopyNode(WorkflowNode):
+class CopyNode(WorkflowNode, names=("CopyNode",)):
     """
     A node that duplicates the output of another node in the workflow.
 
@@ -764,6 +861,7 @@ class CopyNode(WorkflowNode):
     """
 
     node_type = WorkflowNodeType.COPY
+    __slots__ = ("pipeline",)
 
     def __init__(
         self,
@@ -783,17 +881,21 @@ class CopyNode(WorkflowNode):
         return {
             "imports": "",
             "inits": "",
-            "execs": f"{DEFAULT_FLOW_VAR} = {self.dep_vars[0]}"
-            f"({DEFAULT_FLOW_VAR})",
+            "execs": _exec_stmt(self.dep_vars[0]),
         }
 
 
-class BingSearchServiceNode(WorkflowNode):
+class _ServiceNode(WorkflowNode):
     """
-    Bing Search Node
+    Base class of the nodes wrapping a service function. Subclasses set
+    ``service``, and ``bind_kwargs`` when the node's parameters are bound to
+    the function with ``functools.partial``.
     """
 
     node_type = WorkflowNodeType.SERVICE
+    service = None
+    bind_kwargs = False
+    __slots__ = ("service_func",)
 
     def __init__(
         self,
@@ -803,151 +905,173 @@ class BingSearchServiceNode(WorkflowNode):
         dep_opts: list,
     ) -> None:
         super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.service_func = partial(bing_search, **self.opt_kwargs)
+        if self.bind_kwargs:
+            self.service_func = partial(self.service, **self.opt_kwargs)
+        else:
+            self.service_func = self.service
 
     def compile(self) -> dict:
+        service_name = self.service.__name__
+        if self.bind_kwargs:
+            return {
+                "imports": "from agentscope.service import ServiceToolkit\n"
+                "from functools import partial\n"
+                f"from agentscope.service import {service_name}",
+                "inits": f"{self.var_name} = partial({service_name},"
+                f" {kwarg_converter(self.opt_kwargs)})",
+                "execs": "",
+            }
         return {
             "imports": "from agentscope.service import ServiceToolkit\n"
-            "from functools import partial\n"
-            "from agentscope.service import bing_search",
-            "inits": f"{self.var_name} = partial(bing_search,"
-            f" {kwarg_converter(self.opt_kwargs)})",
+            f"from agentscope.service import {service_name}",
+            "inits": f"{self.var_name} = {service_name}",
             "execs": "",
         }
 
 
-class GoogleSearchServiceNode(WorkflowNode):
+class BingSearchServiceNode(_ServiceNode, names=("BingSearchService",)):
     """
-    Google Search Node
+    Bing Search Node
     """
 
-    node_type = WorkflowNodeType.SERVICE
+    service = staticmethod(bing_search)
+    bind_kwargs = True
+    __slots__ = ()
 
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.service_func = partial(google_search, **self.opt_kwargs)
 
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.service import ServiceToolkit\n"
-            "from functools import partial\n"
-            "from agentscope.service import google_search",
-            "inits": f"{self.var_name} = partial(google_search,"
-            f" {kwarg_converter(self.opt_kwargs)})",
-            "execs": "",
-        }
+class GoogleSearchServiceNode(_ServiceNode, names=("GoogleSearchService",)):
+    """
+    Google Search Node
+    """
+
+    service = staticmethod(google_search)
+    bind_kwargs = True
+    __slots__ = ()
 
 
-class PythonServiceNode(WorkflowNode):
+class PythonServiceNode(_ServiceNode, names=("PythonService",)):
     """
     Execute python Node
     """
 
-    node_type = WorkflowNodeType.SERVICE
-
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.service_func = execute_python_code
-
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.service import ServiceToolkit\n"
-            "from agentscope.service import execute_python_code",
-            "inits": f"{self.var_name} = execute_python_code",
-            "execs": "",
-        }
+    service = staticmethod(execute_python_code)
+    __slots__ = ()
 
 
-class ReadTextServiceNode(WorkflowNode):
+class ReadTextServiceNode(_ServiceNode, names=("ReadTextService",)):
     """
     Read Text Service Node
     """
 
-    node_type = WorkflowNodeType.SERVICE
-
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.service_func = read_text_file
-
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.service import ServiceToolkit\n"
-            "from agentscope.service import read_text_file",
-            "inits": f"{self.var_name} = read_text_file",
-            "execs": "",
-        }
+    service = staticmethod(read_text_file)
+    __slots__ = ()
 
 
-class WriteTextServiceNode(WorkflowNode):
+class WriteTextServiceNode(_ServiceNode, names=("WriteTextService",)):
     """
     Write Text Service Node
     """
 
-    node_type = WorkflowNodeType.SERVICE
+    service = staticmethod(write_text_file)
+    __slots__ = ()
 
-    def __init__(
-        self,
-        node_id: str,
-        opt_kwargs: dict,
-        source_kwargs: dict,
-        dep_opts: list,
-    ) -> None:
-        super().__init__(node_id, opt_kwargs, source_kwargs, dep_opts)
-        self.service_func = write_text_file
 
-    def compile(self) -> dict:
-        return {
-            "imports": "from agentscope.service import ServiceToolkit\n"
-            "from agentscope.service import write_text_file",
-            "inits": f"{self.var_name} = write_text_file",
-            "execs": "",
-        }
+def _agent_candidates(participant: WorkflowNode, stack: list) -> tuple:
+    """Return the (agent, variable name) pair of an agent participant."""
+    return ((participant.pipeline, participant.var_name),)
+
 
+def _pipeline_candidates(participant: WorkflowNode, stack: list) -> tuple:
+    """Return the memoized pairs of a nested pipeline participant, or push its
+    participants onto the traversal stack if it has not been memoized yet."""
+    # pylint: disable=protected-access
+    if participant._agents is not None:
+        return participant._agents
+    participants = participant.pipeline.participants
+    if len(participants) == 1:
+        # Single-participant wrappers need no reversed copy
+        stack.append(participants[0])
+    elif participants:
+        stack.extend(reversed(participants))
+    return ()
 
-NODE_NAME_MAPPING = {
-    "dashscope_chat": ModelNode,
-    "openai_chat": ModelNode,
-    "post_api_chat": ModelNode,
-    "post_api_dall_e": ModelNode,
-    "Message": MsgNode,
-    "DialogAgent": DialogAgentNode,
-    "UserAgent": UserAgentNode,
-    "DictDialogAgent": DictDialogAgentNode,
-    "ReActAgent": ReActAgentNode,
-    "Placeholder": PlaceHolderNode,
-    "MsgHub": MsgHubNode,
-    "SequentialPipeline": SequentialPipelineNode,
-    "ForLoopPipeline": ForLoopPipelineNode,
-    "WhileLoopPipeline": WhileLoopPipelineNode,
-    "IfElsePipeline": IfElsePipelineNode,
-    "SwitchPipeline": SwitchPipelineNode,
-    "CopyNode": CopyNode,
-    "BingSearchService": BingSearchServiceNode,
-    "GoogleSearchService": GoogleSearchServiceNode,
-    "PythonService": PythonServiceNode,
-    "ReadTextService": ReadTextServiceNode,
-    "WriteTextService": WriteTextServiceNode,
+
+def _raise_unsupported_participant(participant: WorkflowNode) -> None:
+    """Reject a participant that is neither an agent nor a pipeline."""
+    raise TypeError(
+        f"Unsupported participant type: {type(participant).__name__}",
+    )
+
+
+# Traversal handlers of pipeline participants by node type
+_PARTICIPANT_HANDLERS = {
+    WorkflowNodeType.AGENT: _agent_candidates,
+    WorkflowNodeType.PIPELINE: _pipeline_candidates,
 }
 
 
+def _pipeline_agents(node: WorkflowNode) -> Tuple[Tuple[object, str], ...]:
+    """Return the unique (agent, variable name) pairs of a pipeline node,
+    memoized on the node. Nested pipelines that are already memoized are
+    reused instead of being traversed again.
+
+    The participants of a pipeline are fixed once the node is created, so the
+    memo never goes stale, and it is released together with the node."""
+    # pylint: disable=protected-access
+    if node._agents is not None:
+        return node._agents
+
+    # All nesting levels append into the same list, with the bound methods
+    # resolved once for the whole traversal
+    seen = set()
+    pairs = []
+    mark_seen = seen.add
+    append = pairs.append
+    get_handler = _PARTICIPANT_HANDLERS.get
+
+    # Walk nested pipelines depth-first with an explicit stack, pushing
+    # participants in reverse so they are visited in order
+    stack = list(reversed(node.pipeline.participants))
+    pop = stack.pop
+    while stack:
+        participant = pop()
+        handler = get_handler(participant.node_type)
+        if handler is None:
+            _raise_unsupported_participant(participant)
+        for pair in handler(participant, stack):
+            # Key on the agent's identity so user-defined __eq__/__hash__
+            # are never invoked
+            agent_id = id(pair[0])
+            if agent_id not in seen:
+                mark_seen(agent_id)
+                append(pair)
+
+    node._agents = tuple(pairs)
+    return node._agents
+
+
+def precompute_pipeline_agents(node: WorkflowNode) -> None:
+    """
+    Memoize the agents of a newly built pipeline node, so that later
+    `get_all_agents` calls on it, or on pipelines nesting it, do not traverse
+    it again.
+
+    Pipelines are built after their participants, so nested pipelines are
+    already memoized and only the node's own participants are visited.
+    Pipelines whose participants are not all agents or pipelines are left
+    to fail when their agents are actually requested.
+
+    Args:
+        node (WorkflowNode): The pipeline node to memoize the agents of.
+    """
+    try:
+        _pipeline_agents(node)
+    except (TypeError, AttributeError):
+        # Participants that are neither agents nor pipelines, or are not
+        # workflow nodes at all, such as placeholder operators
+        pass
+
+
 def get_all_agents(
     node: WorkflowNode,
     seen_agents: Optional[set] = None,
@@ -956,8 +1080,9 @@ def get_all_agents(
     """
     Retrieve all unique agent objects from a pipeline.
 
-    Recursively traverses the pipeline to collect all distinct agent-based
-    participants. Prevents duplication by tracking already seen agents.
+    Traverses the pipeline, and the pipelines nested in it, to collect all
+    distinct agent-based participants. Prevents duplication by tracking
+    already seen agents.
 
     Args:
         node (WorkflowNode): The WorkflowNode from which to extract agents.
@@ -967,27 +1092,67 @@ def get_all_agents(
     Returns:
         list: A list of unique agent objects found in the pipeline.
     """
+    return list(iter_all_agents(node, seen_agents, return_var))
+
+
+def iter_all_agents(
+    node: WorkflowNode,
+    seen_agents: Optional[set] = None,
+    return_var: bool = False,
+) -> Generator:
+    """
+    Iterate over the unique agent objects of a pipeline, or their variable
+    names, without building a list of them.
+
+    Args:
+        node (WorkflowNode): The WorkflowNode from which to extract agents.
+        seen_agents (set, optional): A set of agents that have already been
+            seen to avoid duplication. Defaults to None.
+        return_var (bool, optional): Whether to yield the variable names of
+            the agents instead of the agents. Defaults to False.
+
+    Yields:
+        The unique agent objects, or variable names, found in the pipeline.
+    """
     if seen_agents is None:
         seen_agents = set()
 
-    all_agents = []
+    for agent, agent_var in _pipeline_agents(node):
+        if agent not in seen_agents:
+            seen_agents.add(agent)
+            yield agent_var if return_var else agent
 
-    for participant in node.pipeline.participants:
-        if participant.node_type == WorkflowNodeType.AGENT:
-            if participant not in seen_agents:
-                if return_var:
-                    all_agents.append(participant.var_name)
-                else:
-                    all_agents.append(participant.pipeline)
-                seen_agents.add(participant.pipeline)
-        elif participant.node_type == WorkflowNodeType.PIPELINE:
-            nested_agents = get_all_agents(
-                participant,
-                seen_agents,
-                return_var=return_var,
-            )
-            all_agents.extend(nested_agents)
-        else:
-            raise TypeError(type(participant))
 
-    return all_agents
+def get_all_agents_and_vars(
+    node: WorkflowNode,
+    seen_agents: Optional[set] = None,
+) -> Tuple[List, List]:
+    """
+    Retrieve all unique agent objects from a pipeline together with their
+    variable names, in a single traversal.
+
+    Nested pipelines are traversed depth-first with an explicit stack rather
+    than by recursion, visiting participants in order. The result for each
+    pipeline is memoized on the pipeline node.
+
+    Args:
+        node (WorkflowNode): The WorkflowNode from which to extract agents.
+        seen_agents (set, optional): A set of agents that have already been
+            seen to avoid duplication. Defaults to None.
+
+    Returns:
+        tuple: A list of the unique agent objects found in the pipeline, and a
+            list of their variable names in the same order.
+    """
+    if seen_agents is None:
+        seen_agents = set()
+
+    all_agents = []
+    all_agent_vars = []
+    for agent, agent_var in _pipeline_agents(node):
+        if agent not in seen_agents:
+            all_agents.append(agent)
+            all_agent_vars.append(agent_var)
+            seen_agents.add(agent)
+
+    return all_agents, all_agent_vars
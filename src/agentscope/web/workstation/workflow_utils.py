@@ -1,15 +1,38 @@
 # -*- coding: utf-8 -*-
 """Workflow node utils."""
+import builtins
+from functools import lru_cache
+from types import CodeType
+from typing import Any
+
+# Expressions from workflow configs only see the builtins
+_EXPRESSION_GLOBALS = {"__builtins__": builtins}
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(s: str) -> CodeType:
+    """Compile an expression string to a code object, cached by source."""
+    return compile(s, "<workflow-config>", "eval")
+
+
+def evaluate_expression(s: str) -> Any:
+    """Evaluate an expression string with only the builtins in scope.
+
+    Only the compiled code is cached, so every call builds a new value.
+    """
+    try:
+        return eval(compile_expression(s), _EXPRESSION_GLOBALS)
+    except Exception as e:
+        raise ValueError(f"Cannot evaluate expression: {s!r}") from e
 
 
 def is_callable_expression(s: str) -> bool:
     """Check a expression whether a callable expression"""
+    # Do not detect exp like this
+    if not isinstance(s, str) or s in ["input", "print"]:
+        return False
     try:
-        # Do not detect exp like this
-        if s in ["input", "print"]:
-            return False
-        result = eval(s)
-        return callable(result)
+        return callable(eval(compile_expression(s), _EXPRESSION_GLOBALS))
     except Exception:
         return False
 
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the workstation workflow DAG"""
+import threading
+import unittest
+from unittest.mock import patch
+
+from agentscope.web.workstation.workflow_dag import ASDiGraph, build_dag
+
+
+class ASDiGraphRunTest(unittest.TestCase):
+    """Test cases for running an ASDiGraph"""
+
+    def setUp(self) -> None:
+        """Build a DAG whose batch order differs from its compile order"""
+        self.log = []
+        self.dag = ASDiGraph()
+        for node_id in ["a", "b", "c", "d", "e"]:
+            self.dag.add_node(node_id, opt=self._recorder(node_id))
+        self.dag.add_edges_from(
+            [("a", "b"), ("a", "c"), ("b", "d"), ("d", "e")],
+        )
+
+    def _recorder(self, node_id: str):  # type: ignore[no-untyped-def]
+        """Return an operator that records its node and appends to input"""
+
+        def opt(x: str = None) -> str:
+            self.log.append(node_id)
+            return (x or "") + node_id
+
+        return opt
+
+    @patch("agentscope.init")
+    def test_sequential_run_follows_compile_order(self, _) -> None:
+        """Test that the default run executes nodes in compile order"""
+        self.dag.run()
+        self.assertListEqual(self.log, self.dag._sorted_nodes())
+
+    @patch("agentscope.init")
+    def test_parallel_run_executes_batches_concurrently(self, _) -> None:
+        """Test that independent nodes run at the same time with workers"""
+        # b and c only complete if they are executed concurrently
+        barrier = threading.Barrier(2, timeout=5)
+        outputs = {}
+
+        def waiting(node_id: str):  # type: ignore[no-untyped-def]
+            def opt(x: str = None) -> str:
+                barrier.wait()
+                outputs[node_id] = (x or "") + node_id
+                return outputs[node_id]
+
+            return opt
+
+        self.dag.add_node("b", opt=waiting("b"))
+        self.dag.add_node("c", opt=waiting("c"))
+
+        self.dag.run(max_workers=2)
+
+        self.assertEqual(self.log[0], "a")
+        self.assertEqual(outputs, {"b": "ab", "c": "ac"})
+        self.assertEqual(self.log[1:], ["d", "e"])
+
+
+class ASDiGraphMutationTest(unittest.TestCase):
+    """Test that the cached order and operators follow graph mutations"""
+
+    def setUp(self) -> None:
+        """Build a chain a -> b -> c"""
+        self.dag = ASDiGraph()
+        for node_id in ["a", "b", "c"]:
+            self.dag.add_node(node_id, opt=lambda x=None, n=node_id: n)
+        self.dag.add_edges_from([("a", "b"), ("b", "c")])
+        self.assertListEqual(self.dag._sorted_nodes(), ["a", "b", "c"])
+
+    def test_remove_nodes_from(self) -> None:
+        """Test that removed nodes leave the order and operators"""
+        self.assertEqual(self.dag.exec_node("b"), "b")
+        self.dag.remove_nodes_from(["b"])
+        self.assertListEqual(self.dag._sorted_nodes(), ["a", "c"])
+        with self.assertRaises(KeyError):
+            self.dag.exec_node("b")
+
+    def test_remove_edges_from(self) -> None:
+        """Test that removed edges are reflected in the order"""
+        self.dag.remove_edges_from([("a", "b"), ("b", "c")])
+        self.dag.add_edge("c", "a")
+        self.assertLess(
+            self.dag._sorted_nodes().index("c"),
+            self.dag._sorted_nodes().index("a"),
+        )
+
+    def test_clear(self) -> None:
+        """Test that clearing the graph drops the order and operators"""
+        self.assertEqual(self.dag.exec_node("a"), "a")
+        self.dag.clear()
+        self.assertListEqual(self.dag._sorted_nodes(), [])
+        with self.assertRaises(KeyError):
+            self.dag.exec_node("a")
+
+    def test_readded_node_operator(self) -> None:
+        """Test that a node added again executes its new operator"""
+        self.assertEqual(self.dag.exec_node("a"), "a")
+        self.dag.add_nodes_from([("a", {"opt": lambda x=None: "new"})])
+        self.assertEqual(self.dag.exec_node("a"), "new")
+
+    def test_nodes_not_in_graph(self) -> None:
+        """Test that nodes excluded after sorting are left out"""
+        self.dag.nodes_not_in_graph.add("b")
+        self.assertListEqual(self.dag._sorted_nodes(), ["a", "c"])
+
+
+class BuildDagTest(unittest.TestCase):
+    """Test cases for building an ASDiGraph from a workflow config"""
+
+    def test_private_keys_not_in_node_data(self) -> None:
+        """Test that the resolved node classes stay out of the node data"""
+        config = {
+            str(node_id): {
+                "name": "Message",
+                "data": {
+                    "args": {
+                        "name": "Host",
+                        "content": "Hello",
+                        "role": "user",
+                    },
+                },
+                "outputs": {
+                    "output_1": {
+                        "connections": [{"node": "2"}] if node_id == 1 else [],
+                    },
+                },
+            }
+            for node_id in [1, 2]
+        }
+
+        dag = build_dag(config)
+
+        self.assertListEqual(list(dag.edges), [("1", "2")])
+        for node_id in ["1", "2"]:
+            for key in ["_node_cls", "_node_type"]:
+                self.assertNotIn(key, dag.nodes[node_id])
+                self.assertNotIn(key, config[node_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the workstation workflow importer"""
+import asyncio
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from agentscope.web.workstation import workflow_importer
+from agentscope.web.workstation.workflow_importer import (
+    WORKFLOW_SCHEMA,
+    aload_workflow,
+    aload_workflows,
+    convert_to_agentscope_workflow,
+    load_workflow,
+    load_workflows,
+    load_xml_workflow,
+)
+
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+EXAMPLE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "examples",
+    "workflow_importer",
+)
+
+
+def _module(**overrides) -> dict:  # type: ignore[no-untyped-def]
+    """Return a valid module, with the given keys replaced"""
+    module = {"id": 1, "module": "Message", "version": 1, "parameters": {}}
+    module.update(overrides)
+    return module
+
+
+VALID_CONFIGS = [
+    {"modules": [], "connections": {}},
+    {"modules": [_module()], "connections": {"1": {"2": [0]}}},
+    {"modules": [_module(id=2.0, metadata={})], "connections": {}},
+]
+
+INVALID_CONFIGS = [
+    {"modules": {}, "connections": {}},
+    {"modules": [], "connections": []},
+    {"modules": ["1"], "connections": {}},
+    {"modules": [_module(id="1")], "connections": {}},
+    {"modules": [_module(id=True)], "connections": {}},
+    {"modules": [_module(version=1.5)], "connections": {}},
+    {"modules": [_module(module=1)], "connections": {}},
+    {"modules": [_module(parameters=[])], "connections": {}},
+    {"modules": [_module(metadata="")], "connections": {}},
+    {"modules": [{"id": 1, "module": "Message"}], "connections": {}},
+]
+
+
+class WorkflowValidationTest(unittest.TestCase):
+    """Test that every validation backend accepts the same configurations"""
+
+    def _check_backend(self) -> None:
+        """Check the valid and invalid configurations with the patched
+        backend"""
+        for config in VALID_CONFIGS:
+            with self.subTest(config=config):
+                self.assertEqual(
+                    convert_to_agentscope_workflow(config),
+                    config,
+                )
+        for config in INVALID_CONFIGS:
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    convert_to_agentscope_workflow(config)
+
+    @unittest.skipIf(jsonschema_rs is None, "jsonschema-rs is not installed")
+    def test_jsonschema_rs_backend(self) -> None:
+        """Test validation with jsonschema-rs"""
+        with patch.object(
+            workflow_importer,
+            "_WORKFLOW_VALIDATOR",
+            jsonschema_rs.Draft7Validator(WORKFLOW_SCHEMA),
+        ):
+            self._check_backend()
+
+    @unittest.skipIf(fastjsonschema is None, "fastjsonschema is not installed")
+    def test_fastjsonschema_backend(self) -> None:
+        """Test validation with fastjsonschema"""
+        with patch.object(
+            workflow_importer,
+            "_WORKFLOW_VALIDATOR",
+            None,
+        ), patch.object(
+            workflow_importer,
+            "_WORKFLOW_VALIDATE",
+            fastjsonschema.compile(WORKFLOW_SCHEMA),
+        ):
+            self._check_backend()
+
+    def test_unusable_jsonschema_rs(self) -> None:
+        """Test that a jsonschema-rs that cannot compile the schema is
+        skipped instead of failing the import"""
+        for module in [
+            object(),
+            Mock(Draft7Validator=Mock(side_effect=ValueError("schema"))),
+        ]:
+            with self.subTest(module=module), patch.object(
+                workflow_importer,
+                "jsonschema_rs",
+                module,
+            ):
+                self.assertIsNone(
+                    workflow_importer._compile_jsonschema_rs_validator(
+                        WORKFLOW_SCHEMA,
+                    ),
+                )
+
+    def test_python_fallback(self) -> None:
+        """Test validation without a schema validator package"""
+        with patch.object(
+            workflow_importer,
+            "_WORKFLOW_VALIDATOR",
+            None,
+        ), patch.object(workflow_importer, "_WORKFLOW_VALIDATE", None):
+            self._check_backend()
+
+
+class LoadWorkflowsTest(unittest.TestCase):
+    """Test loading several workflow files at once"""
+
+    def setUp(self) -> None:
+        """Collect the paths of the example workflows"""
+        self.paths = [
+            os.path.join(EXAMPLE_DIR, "workflow_example.json"),
+            os.path.join(EXAMPLE_DIR, "workflow_example.xml"),
+            os.path.join(EXAMPLE_DIR, "workflow_example.json"),
+        ]
+
+    def test_load_workflows_order(self) -> None:
+        """Test that the configs are returned in the order of the paths"""
+        self.assertEqual(
+            load_workflows(self.paths, max_workers=3),
+            [load_workflow(path) for path in self.paths],
+        )
+
+    def test_load_workflows_errors(self) -> None:
+        """Test that an error loading any of the files is raised"""
+        missing = os.path.join(EXAMPLE_DIR, "missing_workflow.json")
+        with self.assertRaises(FileNotFoundError) as context:
+            load_workflows(self.paths + [missing])
+        self.assertIsNone(context.exception.__cause__)
+        self.assertTrue(context.exception.__suppress_context__)
+        with self.assertRaises(ValueError):
+            load_workflows([os.path.join(EXAMPLE_DIR, "README.md")])
+
+    def test_aload_workflow(self) -> None:
+        """Test that the async loader returns the same config"""
+        self.assertEqual(
+            asyncio.run(aload_workflow(self.paths[1])),
+            load_workflow(self.paths[1]),
+        )
+
+    def test_aload_workflows(self) -> None:
+        """Test that the async loaders return the configs in path order"""
+        self.assertEqual(
+            asyncio.run(aload_workflows(self.paths)),
+            [load_workflow(path) for path in self.paths],
+        )
+
+
+class XMLWorkflowTest(unittest.TestCase):
+    """Test converting XML workflow files"""
+
+    def test_xml_conversion(self) -> None:
+        """Test the conversion of modules, connections and metadata"""
+        xml = """<workflow>
+          <metadata>
+            <name>demo</name>
+            <metadata><module id="9" type="ignored.nested"/></metadata>
+            <connection from="1" to="2"/>
+          </metadata>
+          <modules>
+            <module id="1" type="a.b" version="2">
+              <parameters>
+                <text>hello</text>
+                <headers><header name="k" value="v"/></headers>
+              </parameters>
+              <position x="10" y="20"/>
+            </module>
+          </modules>
+          <connections><connection from="1" to="3"/></connections>
+        </workflow>"""
+        with tempfile.NamedTemporaryFile(
+            "w",
+            suffix=".xml",
+            delete=False,
+        ) as file:
+            file.write(xml)
+        try:
+            config = load_xml_workflow(file.name)
+        finally:
+            os.remove(file.name)
+
+        nested = {
+            "id": 9,
+            "module": "ignored.nested",
+            "version": 1,
+            "parameters": {},
+            "metadata": {"designer": {"x": 0, "y": 0}},
+        }
+        module = {
+            "id": 1,
+            "module": "a.b",
+            "version": 2,
+            "parameters": {
+                "text": "hello",
+                "headers": [{"name": "k", "value": "v"}],
+            },
+            "metadata": {"designer": {"x": 10, "y": 20}},
+        }
+        self.assertEqual(
+            config,
+            {
+                "metadata": {
+                    "modules": [nested],
+                    "connections": {"1": {"2": [0]}},
+                },
+                "modules": [nested, module],
+                "connections": {"1": {"2": [0], "3": [0]}},
+            },
+        )
+
+
+class CompressedWorkflowTest(unittest.TestCase):
+    """Test loading gzip and zstd compressed workflow files"""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the compressed files"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory"""
+        shutil.rmtree(self.tmp_dir)
+
+    def _example(self, ext: str) -> tuple:
+        """Return the bytes and the loaded config of an example workflow"""
+        path = os.path.join(EXAMPLE_DIR, f"workflow_example{ext}")
+        with open(path, "rb") as file:
+            return file.read(), load_workflow(path)
+
+    def _write(self, name: str, data: bytes) -> str:
+        """Write a file to the temporary directory and return its path"""
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def test_gzip_round_trip(self) -> None:
+        """Test that gzip compressed files load like the originals"""
+        for ext in [".json", ".xml"]:
+            with self.subTest(ext=ext):
+                data, expected = self._example(ext)
+                path = self._write(f"workflow{ext}.gz", gzip.compress(data))
+                self.assertEqual(load_workflow(path), expected)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_round_trip(self) -> None:
+        """Test that zstd compressed files load like the originals"""
+        compressor = zstandard.ZstdCompressor()
+        for ext in [".json", ".xml"]:
+            with self.subTest(ext=ext):
+                data, expected = self._example(ext)
+                path = self._write(
+                    f"workflow{ext}.zst",
+                    compressor.compress(data),
+                )
+                self.assertEqual(load_workflow(path), expected)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_multiple_frames(self) -> None:
+        """Test that every frame of a multi-frame zstd file is read"""
+        compressor = zstandard.ZstdCompressor()
+        for ext in [".json", ".xml"]:
+            with self.subTest(ext=ext):
+                data, expected = self._example(ext)
+                middle = len(data) // 2
+                path = self._write(
+                    f"frames{ext}.zst",
+                    compressor.compress(data[:middle])
+                    + compressor.compress(data[middle:]),
+                )
+                self.assertEqual(load_workflow(path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
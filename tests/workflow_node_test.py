@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the workstation workflow nodes"""
+import unittest
+
+from agentscope.web.workstation.workflow_node import (
+    NODE_NAME_MAPPING,
+    NODE_NAME_MAPPING_VIEW,
+    SequentialPipelineNode,
+    WorkflowNode,
+    WorkflowNodeType,
+    get_all_agents,
+    get_all_agents_and_vars,
+    get_node_class,
+    iter_all_agents,
+)
+
+
+class _AgentNode(WorkflowNode):
+    """Agent node wrapping an arbitrary agent object"""
+
+    node_type = WorkflowNodeType.AGENT
+    __slots__ = ("pipeline",)
+
+    def __init__(self, node_id: str, agent: object) -> None:
+        super().__init__(node_id, {}, {}, [])
+        self.pipeline = agent
+
+    def compile(self) -> dict:
+        return {"imports": "", "inits": "", "execs": ""}
+
+
+class _MessageNode(_AgentNode):
+    """Message node, which is not a valid pipeline participant"""
+
+    node_type = WorkflowNodeType.MESSAGE
+    __slots__ = ()
+
+
+def _pipeline(node_id: str, *participants: WorkflowNode) -> WorkflowNode:
+    """Return a sequential pipeline node of the given participants"""
+    return SequentialPipelineNode(node_id, {}, {}, list(participants))
+
+
+class GetAllAgentsTest(unittest.TestCase):
+    """Test cases for collecting the agents of a pipeline"""
+
+    def setUp(self) -> None:
+        """Build a pipeline that shares an agent with a nested pipeline"""
+        self.agents = [object(), object(), object()]
+        self.nodes = [
+            _AgentNode(str(i), agent) for i, agent in enumerate(self.agents)
+        ]
+        self.inner = _pipeline("10", self.nodes[1], self.nodes[0])
+        self.outer = _pipeline(
+            "11",
+            self.nodes[0],
+            self.inner,
+            self.nodes[2],
+            self.nodes[0],
+        )
+
+    def test_get_all_agents(self) -> None:
+        """Test that nested agents are collected once, in order"""
+        self.assertListEqual(get_all_agents(self.outer), self.agents)
+        self.assertListEqual(
+            get_all_agents(self.outer, return_var=True),
+            ["agent_0", "agent_1", "agent_2"],
+        )
+        self.assertTupleEqual(
+            get_all_agents_and_vars(self.inner),
+            ([self.agents[1], self.agents[0]], ["agent_1", "agent_0"]),
+        )
+
+    def test_iter_all_agents(self) -> None:
+        """Test that the agents are yielded lazily, once each, in order"""
+        seen_agents = set()
+        agents = iter_all_agents(self.outer, seen_agents)
+        self.assertNotIsInstance(agents, list)
+        self.assertIs(next(agents), self.agents[0])
+        self.assertSetEqual(seen_agents, {self.agents[0]})
+        self.assertListEqual(list(agents), self.agents[1:])
+
+        self.assertListEqual(
+            list(iter_all_agents(self.outer, return_var=True)),
+            ["agent_0", "agent_1", "agent_2"],
+        )
+        self.assertListEqual(
+            list(iter_all_agents(self.outer, {self.agents[0]})),
+            self.agents[1:],
+        )
+
+    def test_seen_agents(self) -> None:
+        """Test that agents in the given seen set are skipped and added"""
+        seen_agents = {self.agents[1]}
+        self.assertListEqual(
+            get_all_agents(self.outer, seen_agents),
+            [self.agents[0], self.agents[2]],
+        )
+        self.assertSetEqual(seen_agents, set(self.agents))
+
+        self.assertTupleEqual(
+            get_all_agents_and_vars(self.inner, seen_agents),
+            ([], []),
+        )
+        self.assertTupleEqual(
+            get_all_agents_and_vars(self.inner, {self.agents[0]}),
+            ([self.agents[1]], ["agent_1"]),
+        )
+
+    def test_memoized_on_node(self) -> None:
+        """Test that the agents of a pipeline are memoized on its node"""
+        self.assertIsNone(self.outer._agents)
+        get_all_agents(self.outer)
+        memo = self.outer._agents
+        self.assertEqual(len(memo), 3)
+
+        get_all_agents(self.outer)
+        self.assertIs(self.outer._agents, memo)
+
+    def test_unsupported_participant(self) -> None:
+        """Test that participants other than agents and pipelines raise"""
+        message_node = _MessageNode("20", object())
+        with self.assertRaises(TypeError):
+            get_all_agents(_pipeline("21", message_node))
+
+
+class NodeNameMappingTest(unittest.TestCase):
+    """Test cases for the registry of node classes"""
+
+    def tearDown(self) -> None:
+        """Remove the node names registered by the tests"""
+        NODE_NAME_MAPPING.pop("_TestNode", None)
+
+    def test_subclass_registration(self) -> None:
+        """Test that subclasses are registered under their names"""
+        self.assertIs(
+            NODE_NAME_MAPPING["SequentialPipeline"],
+            SequentialPipelineNode,
+        )
+
+        class _TestNode(_AgentNode, names=("_TestNode",)):
+            """Node registered by subclassing"""
+
+            __slots__ = ()
+
+        self.assertIs(NODE_NAME_MAPPING["_TestNode"], _TestNode)
+        self.assertIs(NODE_NAME_MAPPING_VIEW["_TestNode"], _TestNode)
+
+    def test_external_registration(self) -> None:
+        """Test that the mapping accepts new node types while its view is
+        read-only"""
+        NODE_NAME_MAPPING["_TestNode"] = _AgentNode
+        self.assertIs(NODE_NAME_MAPPING_VIEW["_TestNode"], _AgentNode)
+        with self.assertRaises(TypeError):
+            NODE_NAME_MAPPING_VIEW["_TestNode"] = _MessageNode
+
+    def test_get_node_class(self) -> None:
+        """Test looking up node classes by name"""
+        self.assertIs(
+            get_node_class("SequentialPipeline"),
+            SequentialPipelineNode,
+        )
+        with self.assertRaises(KeyError):
+            get_node_class("_TestNode")
+
+        NODE_NAME_MAPPING["_TestNode"] = _AgentNode
+        self.assertIs(get_node_class("_TestNode"), _AgentNode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the workstation workflow entry points"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from agentscope.web.workstation.workflow import run_and_compile_workflow
+
+
+class RunAndCompileWorkflowTest(unittest.TestCase):
+    """Test cases for compiling and running a workflow together"""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the compiled script"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.compiled_filename = os.path.join(self.tmp_dir, "main.py")
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory"""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_dag_built_once(self) -> None:
+        """Test that a single DAG is compiled and then run"""
+        dag = MagicMock()
+        dag.compile.side_effect = self._write_script
+        config = {"modules": [], "connections": {}}
+
+        with patch(
+            "agentscope.web.workstation.workflow_dag.build_dag",
+            return_value=dag,
+        ) as build_dag:
+            run_and_compile_workflow(config, self.compiled_filename)
+
+        build_dag.assert_called_once_with(config)
+        self.assertListEqual(
+            dag.mock_calls,
+            [call.compile(self.compiled_filename), call.run()],
+        )
+        self.assertTrue(
+            os.listdir(os.path.join(self.tmp_dir, "__pycache__")),
+        )
+
+    def test_compile_error_skips_run(self) -> None:
+        """Test that the workflow is not run if compiling fails"""
+        dag = MagicMock()
+        dag.compile.side_effect = OSError("cannot write")
+
+        with patch(
+            "agentscope.web.workstation.workflow_dag.build_dag",
+            return_value=dag,
+        ):
+            with self.assertRaises(OSError):
+                run_and_compile_workflow({}, self.compiled_filename)
+
+        dag.run.assert_not_called()
+
+    def test_precompile_error_still_runs(self) -> None:
+        """Test that failing to write the bytecode does not stop the run"""
+        dag = MagicMock()
+        dag.compile.side_effect = self._write_script
+
+        with patch(
+            "agentscope.web.workstation.workflow_dag.build_dag",
+            return_value=dag,
+        ), patch(
+            "py_compile.compile",
+            side_effect=PermissionError("read-only directory"),
+        ):
+            run_and_compile_workflow({}, self.compiled_filename)
+
+        self.assertTrue(os.path.exists(self.compiled_filename))
+        dag.run.assert_called_once_with()
+
+    @staticmethod
+    def _write_script(compiled_filename: str) -> None:
+        """Write a minimal script in place of the compiled workflow"""
+        with open(compiled_filename, "w", encoding="utf-8") as file:
+            file.write("print('workflow')\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
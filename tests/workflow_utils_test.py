@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the workstation workflow utils"""
+import unittest
+
+from agentscope.web.workstation.workflow_utils import (
+    evaluate_expression,
+    is_callable_expression,
+)
+
+
+class EvaluateExpressionTest(unittest.TestCase):
+    """Test cases for evaluating expressions from workflow configs"""
+
+    def test_new_value_per_call(self) -> None:
+        """Test that evaluating an expression again builds a new value"""
+        first = evaluate_expression("[]")
+        second = evaluate_expression("[]")
+        self.assertEqual(first, [])
+        self.assertIsNot(first, second)
+
+    def test_invalid_expression(self) -> None:
+        """Test that expressions which cannot be evaluated raise"""
+        for expression in ["[", "undefined_name"]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    evaluate_expression(expression)
+
+    def test_is_callable_expression(self) -> None:
+        """Test detecting expressions that evaluate to callables"""
+        self.assertTrue(is_callable_expression("len"))
+        self.assertFalse(is_callable_expression("[]"))
+        self.assertFalse(is_callable_expression("print"))
+        self.assertFalse(is_callable_expression("["))
+        self.assertFalse(is_callable_expression(1))
+
+
+if __name__ == "__main__":
+    unittest.main()